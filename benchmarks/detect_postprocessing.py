@@ -0,0 +1,155 @@
+"""
+Benchmark of the post-processing step of the Detect transform (everything after the network \
+forward pass). Compares the per-detection Python loops used before with the vectorized \
+implementation on synthetic network outputs.
+
+Usage: python benchmarks/detect_postprocessing.py [--repeat N] [--crowded FRACTION]
+"""
+
+import argparse
+import timeit
+
+import cv2
+import numpy as np
+
+from easycv.transforms.detect import Detect
+
+YOLO_ROWS = (507, 2028, 8112)  # Rows of each yolov3 output layer for a 416x416 input
+SSD_DETECTIONS = 100
+SHAPE = (720, 1280)
+CONFIDENCE = 0.5
+THRESHOLD = 0.3
+
+
+def loop_yolo_boxes(outputs, shape, labels, colors, min_confidence, threshold):
+    h, w = shape
+    rectangles = []
+    confidences = []
+    class_ids = []
+
+    for output in outputs:
+        for detection in output:
+            scores = detection[5:]
+            class_id = np.argmax(scores)
+            confidence = scores[class_id]
+
+            if confidence > min_confidence:
+                rectangle = detection[0:4] * np.array([w, h, w, h])
+                centerX, centerY, width, height = rectangle.astype("int")
+                x = int(centerX - (width / 2))
+                y = int(centerY - (height / 2))
+                rectangles.append([x, y, int(width), int(height)])
+                confidences.append(float(confidence))
+                class_ids.append(class_id)
+
+    indexes_to_keep = cv2.dnn.NMSBoxes(
+        rectangles, confidences, min_confidence, threshold
+    )
+
+    boxes = []
+    if len(indexes_to_keep) > 0:
+        for i in np.array(indexes_to_keep).flatten():
+            x, y = (rectangles[i][0], rectangles[i][1])
+            w, h = (rectangles[i][2], rectangles[i][3])
+            color = [int(c) for c in colors[class_ids[i]]]
+            label = "{}: {:.4f}".format(labels[int(class_ids[i])], confidences[i])
+            boxes.append([[(x, y), (w, h)], color, label])
+
+    return {"boxes": boxes}
+
+
+def loop_ssd_boxes(detections, shape, labels, colors, min_confidence):
+    h, w = shape
+    boxes = []
+    for detection in detections:
+        confidence = detection[2]
+
+        if confidence > min_confidence:
+            idx = int(detection[1])
+            box = detection[3:7] * np.array([w, h, w, h])
+            startX, startY, endX, endY = box.astype("int")
+            width, height = int(endX - startX), int(endY - startY)
+            label = "{}: {:.4f}".format(labels[idx], confidence)
+            color = [int(c) for c in colors[idx]]
+            boxes.append([[(startX, startY), (width, height)], color, label])
+
+    return {"boxes": boxes}
+
+
+def yolo_outputs(crowded, rng):
+    outputs = []
+    for rows in YOLO_ROWS:
+        output = rng.rand(rows, 85).astype("float32")
+        output[:, 2:4] *= 0.2
+        output[:, 5:] *= 0.1
+        confident = rng.rand(rows) < crowded
+        output[confident, 5 + rng.randint(0, 80, confident.sum())] = 0.9
+        outputs.append(output)
+    return outputs
+
+
+def ssd_detections(rng):
+    detections = np.zeros((SSD_DETECTIONS, 7), dtype="float32")
+    detections[:, 1] = rng.randint(1, 21, SSD_DETECTIONS)
+    detections[:, 2] = rng.rand(SSD_DETECTIONS)
+    detections[:, 3:7] = np.sort(rng.rand(SSD_DETECTIONS, 4), axis=1)
+    return detections
+
+
+def measure(function, args, repeat):
+    return min(timeit.repeat(lambda: function(*args), number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--crowded", type=float, default=0.01)
+    options = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    labels = ["class {}".format(i) for i in range(80)]
+    colors = rng.randint(0, 255, size=(len(labels), 3), dtype="uint8")
+
+    cases = [
+        (
+            "yolo",
+            loop_yolo_boxes,
+            Detect._yolo_boxes,
+            (
+                yolo_outputs(options.crowded, rng),
+                SHAPE,
+                labels,
+                colors,
+                CONFIDENCE,
+                THRESHOLD,
+            ),
+        ),
+        (
+            "ssd",
+            loop_ssd_boxes,
+            Detect._ssd_boxes,
+            (ssd_detections(rng), SHAPE, labels[:21], colors, CONFIDENCE),
+        ),
+    ]
+
+    print(
+        "{:<6}{:>12}{:>14}{:>10}{:>8}".format(
+            "model", "loop (ms)", "vector (ms)", "speedup", "boxes"
+        )
+    )
+    for name, loop, vectorized, args in cases:
+        expected = loop(*args)
+        result = vectorized(*args)
+        assert expected == result, "Vectorized output differs from the loop output"
+
+        before = measure(loop, args, options.repeat)
+        after = measure(vectorized, args, options.repeat)
+        print(
+            "{:<6}{:>12.2f}{:>14.2f}{:>9.1f}x{:>8}".format(
+                name, before, after, before / after, len(result["boxes"])
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark of the time needed to import easycv. Each measurement runs in a new interpreter so \
+nothing is cached between runs. Also lists the heavy optional dependencies that are loaded by \
+the import (they should only be loaded when a feature that needs them is used).
+
+Usage: python benchmarks/import_time.py [--repeat N] [--module MODULE]
+"""
+
+import argparse
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "ray",
+    "sklearn",
+    "skimage",
+    "matplotlib",
+    "PIL",
+    "pyzbar",
+    "color_transfer",
+)
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(",".join(m for m in {heavy} if m in sys.modules))
+"""
+
+
+def measure(module):
+    script = SCRIPT.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.check_output([sys.executable, "-c", script])
+    lines = output.decode().split("\n")
+    return float(lines[0]), lines[1].strip()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--module", default="easycv")
+    args = parser.parse_args()
+
+    times = []
+    loaded = ""
+    for _ in range(args.repeat):
+        elapsed, loaded = measure(args.module)
+        times.append(elapsed)
+
+    print(
+        "import {}: best {:.0f} ms, mean {:.0f} ms ({} runs)".format(
+            args.module, min(times) * 1000, sum(times) / len(times) * 1000, len(times)
+        )
+    )
+    print("heavy dependencies loaded: {}".format(loaded if loaded else "none"))
+
+
+if __name__ == "__main__":
+    main()
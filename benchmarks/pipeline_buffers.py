@@ -0,0 +1,101 @@
+"""
+Benchmark of the buffer-reusing execution mode of pipelines. Applies the same pipeline to a \
+sequence of frames calling the pipeline once per frame (new intermediate arrays for every \
+frame) and through Pipeline.stream (intermediate arrays are reused between frames). \
+Reports the time per frame and the memory allocated while processing each frame (peak \
+traced by tracemalloc, also in multiples of the input frame size).
+
+Usage: python benchmarks/pipeline_buffers.py [--frames N] [--width W] [--height H]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from easycv.pipeline import Pipeline
+from easycv.transforms import (
+    Blur,
+    Brightness,
+    Contrast,
+    Erode,
+    GrayScale,
+    Mirror,
+    Resize,
+)
+
+
+def run(pipeline, frames, stream):
+    start = time.perf_counter()
+    if stream:
+        for _ in pipeline.stream(frames, reuse_output=True):
+            pass
+    else:
+        for frame in frames:
+            pipeline(frame)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def allocated(pipeline, frames, stream):
+    # tracing slows everything down so it runs apart from the timed loop
+    outputs = pipeline.stream(frames, reuse_output=True) if stream else None
+    peaks = []
+    for frame in frames:
+        tracemalloc.start()
+        if stream:
+            next(outputs)
+        else:
+            pipeline(frame)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    # the first streamed frame allocates the reused buffers
+    return np.mean(peaks[1:])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--width", type=int, default=1920)
+    parser.add_argument("--height", type=int, default=1080)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    frames = [
+        rng.randint(0, 256, (args.height, args.width, 3)).astype("uint8")
+        for _ in range(args.frames)
+    ]
+    pipeline = Pipeline(
+        [
+            Mirror(axis="y"),
+            Blur(size=5),
+            Brightness(beta=20),
+            Contrast(alpha=1.2),
+            Erode(size=3),
+            Resize(width=args.width // 2, height=args.height // 2),
+            GrayScale(),
+        ]
+    )
+
+    results = [pipeline(frame)["image"] for frame in frames[:5]]
+    streamed = [
+        o["image"].copy() for o in pipeline.stream(frames[:5], reuse_output=True)
+    ]
+    assert all(np.array_equal(a, b) for a, b in zip(results, streamed))
+
+    for stream in (False, True):
+        run(pipeline, frames[:5], stream)  # warm up
+        name = "stream" if stream else "call"
+        size = allocated(pipeline, frames[:10], stream)
+        print(
+            "{:>6}: {:.2f} ms/frame, {:.2f} MB/frame allocated ({:.2f} frames)".format(
+                name,
+                run(pipeline, frames, stream) * 1000,
+                size / 2 ** 20,
+                size / frames[0].nbytes,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
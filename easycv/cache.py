@@ -0,0 +1,240 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+
+import numpy as np
+
+import easycv
+import easycv.image
+from easycv.io.input import get_image_array
+from easycv.pipeline import Pipeline
+from easycv.transforms.base import Transform
+
+
+def _default_folder():
+    folder = os.environ.get("EASYCV_CACHE_DIR")
+    if folder:
+        return folder
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "easycv", "results")
+
+
+def _describe(value, digest):
+    if isinstance(value, Pipeline):
+        digest.update(b"pipeline")
+        for transform in value.transforms():
+            _describe(transform, digest)
+    elif isinstance(value, Transform):
+        digest.update(
+            "{}.{}".format(type(value).__module__, type(value).__name__).encode()
+        )
+        _describe(value.args, digest)
+    elif isinstance(value, easycv.image.Image):
+        _describe(value.array, digest)
+    elif isinstance(value, np.ndarray):
+        digest.update("array{}{}".format(value.dtype.str, value.shape).encode())
+        digest.update(np.ascontiguousarray(value).data)
+    elif isinstance(value, dict):
+        digest.update(b"dict")
+        for key in sorted(value, key=str):
+            _describe(key, digest)
+            _describe(value[key], digest)
+    elif isinstance(value, (list, tuple)):
+        digest.update(type(value).__name__.encode())
+        for item in value:
+            _describe(item, digest)
+    elif value is None or isinstance(value, (str, int, float, bool)):
+        digest.update(repr(value).encode())
+    else:
+        digest.update(pickle.dumps(value, protocol=4))
+
+
+def fingerprint(operation):
+    """
+    Returns a stable fingerprint of a transform/pipeline: the same transforms (in the same order) \
+    with the same arguments always have the same fingerprint, in any process. The easycv version \
+    is part of the fingerprint, so results computed by other versions are never reused.
+
+    :param operation: Transform or pipeline
+    :type operation: :class:`~easycv.transforms.base.Transform`/\
+    :class:`~easycv.pipeline.Pipeline`
+    :return: Fingerprint (hexadecimal)
+    :rtype: :class:`str`
+    """
+    digest = hashlib.sha1(easycv.__version__.encode())
+    _describe(operation, digest)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    This class represents a persistent cache of results. Each result is stored in a file, keyed \
+    by the input image (a hash of its pixels, or the path, modification time and size for lazy \
+    images from files that are not loaded yet) and the :func:`fingerprint` of the \
+    transforms applied to it. Several processes can share the same folder. When the cache \
+    exceeds its maximum size the least recently used results are removed.
+
+    Results of transforms that are not deterministic (e.g. \
+    :class:`~easycv.transforms.noise.Noise`) are cached like any other, so the same output is \
+    returned every time.
+
+    Results are stored with :mod:`pickle`, which can run arbitrary code when loading. Only use \
+    folders that can't be written by untrusted users.
+
+    :param folder: Folder where results are stored, defaults to `EASYCV_CACHE_DIR` (if the \
+    environment variable is set) or ~/.cache/easycv/results
+    :type folder: :class:`str`, optional
+    :param max_size: Maximum size of the cache in bytes, defaults to 1GB
+    :type max_size: :class:`int`, optional
+    """
+
+    def __init__(self, folder=None, max_size=2 ** 30):
+        self.folder = str(folder) if folder is not None else _default_folder()
+        self.max_size = max_size
+        self._size = None  # Unknown until the folder is scanned
+        self._lock = threading.Lock()
+        os.makedirs(self.folder, exist_ok=True)
+
+    def key(self, image, operation=None):
+        """
+        Returns the key of the result of applying the pending operations of an **image** and \
+        then the given operation.
+
+        :param image: Input image
+        :type image: :class:`~easycv.image.Image`
+        :param operation: Operation applied after the pending operations, defaults to None
+        :type operation: :class:`~easycv.transforms.base.Transform`/\
+        :class:`~easycv.pipeline.Pipeline`, optional
+        :return: Key of the result
+        :rtype: :class:`str`
+        """
+        digest = hashlib.sha1()
+        source = image._source if image._lazy and not image.loaded else None
+        if isinstance(source, str) and os.path.isfile(source):
+            stat = os.stat(source)
+            digest.update(
+                "file{}{}{}".format(
+                    os.path.abspath(source), stat.st_mtime_ns, stat.st_size
+                ).encode()
+            )
+        else:
+            array = image._img
+            if array is None:
+                # the data is read without loading the image (it stays as it was)
+                array = get_image_array(source)
+            _describe(array, digest)
+
+        if image._lazy:
+            digest.update(fingerprint(image.pending).encode())
+        if operation is not None:
+            digest.update(fingerprint(operation).encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.folder, key[:2], key)
+
+    def get(self, key):
+        """
+        Returns a stored result (and marks it as recently used).
+
+        :param key: Key of the result
+        :type key: :class:`str`
+        :return: The result or None if it isn't in the cache
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError):
+            # incomplete or corrupted entry
+            self._remove(path)
+            return None
+
+    def put(self, key, value):
+        """
+        Stores a result. Results are written to a temporary file and then renamed, so processes \
+        sharing the cache never read incomplete results.
+
+        :param key: Key of the result
+        :type key: :class:`str`
+        :param value: Result (image array or outputs dictionary)
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=4)
+        size = os.path.getsize(temporary)
+        os.replace(temporary, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self.size
+            else:
+                self._size += size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _entries(self):
+        for folder in os.scandir(self.folder):
+            if folder.is_dir():
+                for entry in os.scandir(folder.path):
+                    if not entry.name.endswith(".tmp"):
+                        yield entry
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        # remove the least recently used entries until 90% of the maximum size
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= 0.9 * self.max_size:
+                break
+            self._remove(path)
+            self._size -= size
+
+    @property
+    def size(self):
+        """
+        Returns the size of all stored results in bytes.
+
+        :return: Size of the cache
+        :rtype: :class:`int`
+        """
+        total = 0
+        for entry in self._entries():
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def clear(self):
+        """
+        Removes all stored results.
+        """
+        with self._lock:
+            for entry in list(self._entries()):
+                self._remove(entry.path)
+            self._size = 0
@@ -1,4 +1,5 @@
-from functools import wraps
+import asyncio
+from functools import partial, wraps
 
 from easycv.pipeline import Pipeline
 
@@ -12,6 +13,19 @@ def auto_compute(decorated):
     return wrapper
 
 
+async def run_in_executor(function, *args, executor=None, semaphore=None, **kwargs):
+    """
+    Runs a blocking function in an executor (the default executor of the event loop if none is \
+    given) without blocking the event loop. If a semaphore is given it limits how many functions \
+    run at the same time.
+    """
+    loop = asyncio.get_event_loop()
+    if semaphore is None:
+        return await loop.run_in_executor(executor, partial(function, *args, **kwargs))
+    async with semaphore:
+        return await loop.run_in_executor(executor, partial(function, *args, **kwargs))
+
+
 class Collection:
     def __init__(self, pending=None, lazy=False):
         self._lazy = lazy
@@ -12,6 +12,7 @@ from easycv.errors.io import (
     ImageDownloadError,
     ImageDecodeError,
     ImageSaveError,
+    InvalidContainerError,
     InvalidPipelineInputSource,
 )
 
@@ -19,6 +20,7 @@ from easycv.errors.resources import (
     ErrorDownloadingResource,
     InvalidResource,
     FileNotInResource,
+    InvalidNetwork,
 )
 
 from easycv.errors.list import InvalidListInputSource
@@ -35,7 +37,9 @@ __all__ = [
     "InvalidResource",
     "ErrorDownloadingResource",
     "FileNotInResource",
+    "InvalidNetwork",
     "ImageSaveError",
+    "InvalidContainerError",
     "UnsupportedArgumentError",
     "InvalidListInputSource",
     "InvalidPipelineInputSource",
@@ -22,6 +22,11 @@ class ImageSaveError(Exception):
     pass
 
 
+class InvalidContainerError(Exception):
+    def __init__(self):
+        super().__init__("The given file is not a valid image container")
+
+
 class InvalidPipelineInputSource(Exception):
     def __init__(self):
         super().__init__(
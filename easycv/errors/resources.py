@@ -13,3 +13,8 @@ class FileNotInResource(Exception):
         super().__init__(
             "Requested file not inside the resource {}.".format(resource_name)
         )
+
+
+class InvalidNetwork(Exception):
+    def __init__(self, network_name):
+        super().__init__("Network '{}' is not registered.".format(network_name))
@@ -0,0 +1,989 @@
+import itertools
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from concurrent.futures import ProcessPoolExecutor as _ProcessPool
+from concurrent.futures import ThreadPoolExecutor as _ThreadPool
+from copy import copy
+from functools import lru_cache, partial
+
+import numpy as np
+
+import easycv.image
+from easycv.io.output import write_image
+from easycv.pipeline import Pipeline
+
+TASK_TIME = 0.05  # Target duration (in seconds) of each task when chunks are sized automatically
+ERROR_POLICIES = ("raise", "skip", "record")
+# multiprocessing.shared_memory is only available since Python 3.8, older versions pickle images
+SHARED_MEMORY = sys.version_info >= (3, 8)
+
+
+class ImageFailure:
+    """
+    Record of an image that couldn't be processed (see the `errors` argument of \
+    :meth:`~easycv.list.List.apply`). Only the description of the error is kept, so records \
+    can be sent between processes.
+
+    :param error: The exception raised by the last attempt
+    :type error: :class:`Exception`
+    :param attempts: Number of attempts, defaults to 1
+    :type attempts: :class:`int`, optional
+    :param index: Position of the image in the **list**, defaults to None
+    :type index: :class:`int`, optional
+    """
+
+    def __init__(self, error, attempts=1, index=None):
+        self.index = index
+        self.error_type = type(error).__name__
+        self.message = str(error)
+        self.traceback = "".join(
+            traceback.format_exception(type(error), error, error.__traceback__)
+        )
+        self.attempts = attempts
+
+    def __repr__(self):
+        return "<failure index={} error={}: {}>".format(
+            self.index, self.error_type, self.message
+        )
+
+
+def summarize_failures(failures, total):
+    """
+    Returns a short description of the failures of an operation.
+
+    :param failures: Failure records
+    :type failures: :class:`list`
+    :param total: Number of images processed
+    :type total: :class:`int`
+    :return: Summary of the failures
+    :rtype: :class:`str`
+    """
+    counts = {}
+    for failure in failures:
+        counts[failure.error_type] = counts.get(failure.error_type, 0) + 1
+    errors = ", ".join("{} {}".format(n, error) for error, n in sorted(counts.items()))
+    first = failures[0]
+    return "{} of {} images failed ({}), first at index {}: {}".format(
+        len(failures), total, errors, first.index, first.message
+    )
+
+
+def check_error_policy(errors):
+    """
+    Raises a :class:`ValueError` if the error policy isn't one of "raise", "skip" or "record".
+
+    :param errors: Error policy
+    :type errors: :class:`str`
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError(
+            "Unknown error policy {}, use one of {}".format(
+                errors, ", ".join(ERROR_POLICIES)
+            )
+        )
+
+
+def _guarded(function, retries, image):
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            return function(image)
+        except Exception as error:
+            if attempts > retries:
+                return ImageFailure(error, attempts=attempts)
+
+
+def guard(function, errors, retries):
+    """
+    Returns a version of a function that returns an :class:`ImageFailure` instead of raising \
+    (after retrying `retries` times), unless the error policy is "raise".
+
+    :param function: Function that receives an image
+    :type function: :class:`function`
+    :param errors: Error policy
+    :type errors: :class:`str`
+    :param retries: Number of times the function is retried after failing
+    :type retries: :class:`int`
+    :return: The guarded function
+    :rtype: :class:`function`
+    """
+    if errors == "raise":
+        return function
+    return partial(_guarded, function, retries)
+
+
+def _compute_image(image):
+    return image.compute(in_place=False)
+
+
+def _apply_image(operation, image):
+    # local workers do the whole computation, lazy results are computed before returning
+    output = operation.apply(image)
+    if isinstance(output, easycv.image.Image) and output._lazy:
+        output.compute(in_place=True)
+    return output
+
+
+def _map_chunk(function, images):
+    return [function(image) for image in images]
+
+
+def _write_output(output, name, image):
+    # runs in a worker, the image is written to the output folder and only its path is returned
+    os.makedirs(output["folder"], exist_ok=True)
+    filename = os.path.join(output["folder"], "{}.{}".format(name, output["format"]))
+    write_image(
+        image.array,
+        filename,
+        output["format"],
+        quality=output["quality"],
+        compression=output["compression"],
+    )
+    return filename
+
+
+def _ray_chunk(operation, images, loaded, errors, retries, output, names, *arrays):
+    # runs in a ray worker, arrays are read-only views of the object store (no copies) and
+    # images that aren't loaded (e.g. lazy images from paths/links) are opened by the worker
+    if operation is None:
+        function = _compute_image
+    else:
+        function = partial(_apply_image, operation)
+    function = guard(function, errors, retries)
+
+    arrays = iter(arrays)
+    outputs = []
+    failures = []
+    cost = None
+    for position, (image, is_loaded, name) in enumerate(zip(images, loaded, names)):
+        start = time.perf_counter()
+        if is_loaded:
+            image._img = next(arrays)
+        result = function(image)
+        if isinstance(result, ImageFailure):
+            failures.append((position, result))
+            result = None
+        elif isinstance(result, easycv.image.Image):
+            if output is not None:
+                try:
+                    result = _write_output(output, name, result)
+                except Exception as error:
+                    if errors == "raise":
+                        raise
+                    failures.append((position, ImageFailure(error)))
+                    result = None
+            else:
+                result = result.array
+        outputs.append(result)
+        if cost is None:
+            cost = time.perf_counter() - start
+    # one object (and reference) for each image and a last one with the failures and the time
+    # taken by the first image (measured here, without the overhead of the task)
+    return tuple(outputs) + ((failures, cost),)
+
+
+def _contiguous(operation):
+    # image arguments are stored as contiguous arrays, so workers read them without copies
+    if isinstance(operation, Pipeline):
+        transforms = [_contiguous(t) for t in operation.transforms()]
+        if all(a is b for a, b in zip(transforms, operation.transforms())):
+            return operation
+        operation = copy(operation)
+        operation._transforms = transforms
+        return operation
+
+    arguments = {}
+    for name, value in (operation.args or {}).items():
+        if (
+            isinstance(value, easycv.image.Image)
+            and value.loaded
+            and not value._img.flags.c_contiguous
+        ):
+            arguments[name] = easycv.image.Image._wrap(np.ascontiguousarray(value._img))
+    if not arguments:
+        return operation
+    operation = copy(operation)
+    operation._args = dict(operation._args, **arguments)
+    return operation
+
+
+@lru_cache(maxsize=None)
+def _remote(function):
+    # ray is only imported (and remote functions created) when parallel processing is used
+    import ray
+
+    return ray.remote(function)
+
+
+def _share(array, name=None):
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(
+        name=name, create=True, size=max(array.nbytes, 1)
+    )
+    np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _attach(shared):
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=shared[0])
+    return block, np.ndarray(shared[1], shared[2], buffer=block.buf)
+
+
+def _unlink_outputs(prefix, count):
+    # removes the outputs already shared by a task whose worker crashed
+    from multiprocessing import shared_memory
+
+    for position in range(count):
+        try:
+            block = shared_memory.SharedMemory(name=prefix + str(position))
+        except FileNotFoundError:
+            continue
+        block.close()
+        block.unlink()
+
+
+def _run_shared(function, images, shared, prefix):
+    # runs in a worker process, input and output image data go through shared memory. Output
+    # blocks are named after the task prefix, so they can be removed if the worker crashes
+    outputs = []
+    for position, (image, image_shared) in enumerate(zip(images, shared)):
+        block = None
+        if image_shared is not None:
+            block, image._img = _attach(image_shared)
+
+        try:
+            output = function(image)
+            if isinstance(output, easycv.image.Image) and SHARED_MEMORY:
+                output_block, output = _share(output.array, prefix + str(position))
+                output_block.close()
+                outputs.append((True, output))
+            else:
+                outputs.append((False, output))
+        finally:
+            if block is not None:
+                image._img = None
+                try:
+                    block.close()
+                except BufferError:
+                    pass  # the output still references the input, released with the process
+    return outputs
+
+
+def _stream(submit, wait_any, result, images, in_flight, ordered):
+    # keeps up to in_flight tasks running (or finished and waiting for their turn when ordered)
+    # and yields (index, result) pairs as tasks finish
+    pending = {}
+    finished = {}
+    next_index = 0
+    images = enumerate(images)
+    exhausted = False
+    while True:
+        while not exhausted and len(pending) + len(finished) < in_flight:
+            item = next(images, None)
+            if item is None:
+                exhausted = True
+            else:
+                pending[submit(item[1])] = item[0]
+
+        if not pending and not finished:
+            return
+
+        for task in wait_any(list(pending)) if pending else ():
+            index = pending.pop(task)
+            if ordered:
+                finished[index] = result(task)
+            else:
+                yield index, result(task)
+
+        while next_index in finished:
+            yield next_index, finished.pop(next_index)
+            next_index += 1
+
+
+def _wait_futures(futures):
+    return wait(futures, return_when=FIRST_COMPLETED).done
+
+
+def auto_chunk_size(cost, count, workers):
+    """
+    Returns the number of images processed by each task, so that each task takes about \
+    `TASK_TIME` seconds (the overhead of scheduling a task is small compared to its work) while \
+    every worker still gets several tasks (so the work stays balanced).
+
+    :param cost: Time to process one image in seconds
+    :type cost: :class:`float`
+    :param count: Number of images
+    :type count: :class:`int`
+    :param workers: Number of workers
+    :type workers: :class:`int`
+    :return: Number of images of each task
+    :rtype: :class:`int`
+    """
+    size = int(TASK_TIME / max(cost, 1e-6))
+    balanced = -(-count // (4 * workers))  # at least 4 tasks per worker
+    return max(1, min(size, balanced))
+
+
+class Executor:
+    """
+    Base class of the executors used by :meth:`~easycv.list.List.apply` and \
+    :meth:`~easycv.list.List.compute` to process the images of a **list** in parallel. \
+    Images are processed in chunks (one task for each chunk). Unless a chunk size is given, the \
+    first image is processed right away to measure its cost and the size of the chunks is \
+    chosen from it (see :func:`auto_chunk_size`). Executors return the results in the same \
+    order as the images.
+
+    With the "skip" and "record" error policies, images that fail (after the given number of \
+    retries) get an :class:`ImageFailure` instead of a result. If a whole task is lost (e.g. a \
+    worker process crashes) every image of the task gets one.
+    """
+
+    workers = 1
+
+    def _split(self, function, images, chunk_size):
+        images = list(images)
+        results = []
+        if chunk_size is None and images:
+            start = time.perf_counter()
+            results.append(function(images[0]))
+            images = images[1:]
+            cost = time.perf_counter() - start
+            chunk_size = auto_chunk_size(cost, len(images), self.workers)
+        chunks = [
+            images[i : i + chunk_size] for i in range(0, len(images), chunk_size or 1)
+        ]
+        return results, chunks
+
+    def _map_chunks(self, function, chunks, errors, retries=0):
+        pass
+
+    def map(self, function, images, chunk_size=None, errors="raise", retries=0):
+        """
+        Applies a function to every image.
+
+        :param function: Function that receives an image and returns the result
+        :type function: :class:`function`
+        :param images: Images to process
+        :type images: :class:`list`
+        :param chunk_size: Number of images processed by each task, defaults to automatic
+        :type chunk_size: :class:`int`, optional
+        :param errors: Error policy, "raise" to stop at the first error, "skip" or "record" to \
+        return an :class:`ImageFailure` for the images that fail, defaults to "raise"
+        :type errors: :class:`str`, optional
+        :param retries: Number of times an image is retried after failing, defaults to 0
+        :type retries: :class:`int`, optional
+        :return: Results in the same order as the images
+        :rtype: :class:`list`
+        """
+        check_error_policy(errors)
+        function = guard(function, errors, retries)
+        results, chunks = self._split(function, images, chunk_size)
+        for outputs in self._map_chunks(function, chunks, errors, retries):
+            results.extend(outputs)
+        return results
+
+    def apply(self, operation, images, chunk_size=None, errors="raise", retries=0):
+        """
+        Applies an operation to every image. Lazy images are computed.
+
+        :param operation: Operation to be applied
+        :type operation: :class:`~easycv.transforms.operation.Operation`
+        :param images: Images to process
+        :type images: :class:`list`
+        :param chunk_size: Number of images processed by each task, defaults to automatic
+        :type chunk_size: :class:`int`, optional
+        :param errors: Error policy (see :meth:`map`), defaults to "raise"
+        :type errors: :class:`str`, optional
+        :param retries: Number of times an image is retried after failing, defaults to 0
+        :type retries: :class:`int`, optional
+        :return: Outputs (images or outputs dictionaries) in the same order as the images
+        :rtype: :class:`list`
+        """
+        return self.map(
+            partial(_apply_image, operation),
+            images,
+            chunk_size=chunk_size,
+            errors=errors,
+            retries=retries,
+        )
+
+    def compute(self, images, chunk_size=None, errors="raise", retries=0):
+        """
+        Computes every image (applies the pending operations).
+
+        :param images: Images to compute
+        :type images: :class:`list`
+        :param chunk_size: Number of images processed by each task, defaults to automatic
+        :type chunk_size: :class:`int`, optional
+        :param errors: Error policy (see :meth:`map`), defaults to "raise"
+        :type errors: :class:`str`, optional
+        :param retries: Number of times an image is retried after failing, defaults to 0
+        :type retries: :class:`int`, optional
+        :return: Computed images in the same order
+        :rtype: :class:`list`
+        """
+        return self.map(
+            _compute_image,
+            images,
+            chunk_size=chunk_size,
+            errors=errors,
+            retries=retries,
+        )
+
+    def imap(
+        self,
+        operation,
+        images,
+        in_flight=None,
+        ordered=False,
+        errors="raise",
+        retries=0,
+    ):
+        """
+        Applies an operation to every image and yields `(index, output)` pairs as soon as each \
+        image is processed. At most `in_flight` images are being processed (or waiting to be \
+        yielded) at the same time, so the outputs don't accumulate in memory.
+
+        :param operation: Operation to be applied
+        :type operation: :class:`~easycv.transforms.operation.Operation`
+        :param images: Images to process
+        :type images: :class:`iterable`
+        :param in_flight: Maximum number of images being processed, defaults to twice the \
+        number of workers
+        :type in_flight: :class:`int`, optional
+        :param ordered: `True` to yield the outputs in the same order as the images, `False` \
+        to yield them as they finish, defaults to `False`
+        :type ordered: :class:`bool`, optional
+        :param errors: Error policy (see :meth:`map`), defaults to "raise"
+        :type errors: :class:`str`, optional
+        :param retries: Number of times an image is retried after failing, defaults to 0
+        :type retries: :class:`int`, optional
+        :return: Generator of `(index, output)` pairs
+        :rtype: :class:`generator`
+        """
+        pass
+
+
+class SerialExecutor(Executor):
+    """
+    Executor that processes one image at a time in the current thread.
+    """
+
+    def map(self, function, images, chunk_size=None, errors="raise", retries=0):
+        check_error_policy(errors)
+        function = guard(function, errors, retries)
+        return [function(image) for image in images]
+
+    def imap(
+        self,
+        operation,
+        images,
+        in_flight=None,
+        ordered=False,
+        errors="raise",
+        retries=0,
+    ):
+        check_error_policy(errors)
+        function = guard(partial(_apply_image, operation), errors, retries)
+        for index, image in enumerate(images):
+            yield index, function(image)
+
+
+class ThreadExecutor(Executor):
+    """
+    Executor that processes images in a pool of threads. Most OpenCV functions release the GIL, \
+    so this is the cheapest way to use several cores with those transforms (no data is copied).
+
+    :param workers: Number of threads, defaults to the number of cpus
+    :type workers: :class:`int`, optional
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+
+    def _map_chunks(self, function, chunks, errors, retries=0):
+        with _ThreadPool(max_workers=self.workers) as pool:
+            return list(pool.map(partial(_map_chunk, function), chunks))
+
+    def imap(
+        self,
+        operation,
+        images,
+        in_flight=None,
+        ordered=False,
+        errors="raise",
+        retries=0,
+    ):
+        check_error_policy(errors)
+        function = guard(partial(_apply_image, operation), errors, retries)
+        with _ThreadPool(max_workers=self.workers) as pool:
+            yield from _stream(
+                partial(pool.submit, function),
+                _wait_futures,
+                lambda future: future.result(),
+                images,
+                in_flight or 2 * self.workers,
+                ordered,
+            )
+
+
+class ProcessExecutor(Executor):
+    """
+    Executor that processes images in a pool of processes, for transforms that hold the GIL. \
+    Image data is passed to and from the workers through shared memory (not pickled). Lazy \
+    images that are not loaded are sent as they are, so the workers also do the decoding.
+
+    Shared memory requires Python 3.8 or newer, on older versions images are pickled (slower \
+    for large images, but the results are the same).
+
+    If a worker process crashes, the remaining images go to a fresh pool and the images of the \
+    lost tasks run again one at a time in their own process, so only the image that crashes \
+    fails (after `retries` more attempts).
+
+    :param workers: Number of processes, defaults to the number of cpus
+    :type workers: :class:`int`, optional
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+
+    @staticmethod
+    def _release(blocks):
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    @classmethod
+    def _collect(cls, task, errors="raise"):
+        blocks, future, count = task
+        try:
+            outputs = future.result()
+        except Exception as error:
+            if errors == "raise":
+                raise
+            # the whole task was lost (e.g. the worker process crashed)
+            return [ImageFailure(error) for _ in range(count)]
+        finally:
+            cls._release(blocks)
+
+        results = []
+        for shared, output in outputs:
+            if shared:
+                output_block, array = _attach(output)
+                array = array.copy()
+                cls._release([output_block])
+                output = easycv.image.Image._wrap(array)
+            results.append(output)
+        return results
+
+    @staticmethod
+    def _pack(chunk):
+        if not SHARED_MEMORY:
+            return [], list(chunk), [None] * len(chunk)
+
+        blocks, images, shared = [], [], []
+        for image in chunk:
+            image_shared = None
+            if image.loaded:
+                block, image_shared = _share(image._img)
+                blocks.append(block)
+                image = copy(image)
+                image._img = None
+            images.append(image)
+            shared.append(image_shared)
+        return blocks, images, shared
+
+    @staticmethod
+    def _start_tracker():
+        if not SHARED_MEMORY:
+            return
+
+        from multiprocessing import resource_tracker
+
+        # workers must share the resource tracker of this process, shared memory blocks are
+        # created and removed by different processes
+        resource_tracker.ensure_running()
+
+    @classmethod
+    def _discard(cls, task):
+        # tasks that already started are waited for, so their shared memory is released
+        if task[1].cancel():
+            cls._release(task[0])
+        else:
+            cls._collect(task, errors="skip")
+
+    def _submit(self, pool, function, chunk):
+        blocks, images, shared = self._pack(chunk)
+        prefix = "ecv{}_".format(os.urandom(6).hex())
+        try:
+            future = pool.submit(_run_shared, function, images, shared, prefix)
+        except BrokenProcessPool:
+            self._release(blocks)
+            raise
+        return blocks, future, prefix
+
+    def _lost(self, blocks, prefix, count):
+        # the worker crashed, the outputs it already shared are removed with the inputs
+        self._release(blocks)
+        if SHARED_MEMORY:
+            _unlink_outputs(prefix, count)
+
+    def _run_pool(self, function, chunks, queue, results, errors, workers, in_flight):
+        # processes the chunks of the queue (indices) until it is empty or a worker crashes,
+        # returns the (index, error) of the chunks lost because the pool broke
+        lost = []
+        tasks = deque()
+        with _ProcessPool(max_workers=workers) as pool:
+            try:
+                while queue and not lost:
+                    # limit the shared memory used by images waiting to be processed
+                    if len(tasks) >= in_flight:
+                        self._finish(tasks.popleft(), chunks, results, lost, errors)
+                        continue
+
+                    index = queue.popleft()
+                    try:
+                        task = self._submit(pool, function, chunks[index])
+                    except BrokenProcessPool:
+                        # the crash happened in a running task, this chunk is sent again
+                        queue.appendleft(index)
+                        break
+                    tasks.append(task + (index,))
+
+                while tasks:
+                    self._finish(tasks.popleft(), chunks, results, lost, errors)
+            finally:
+                for blocks, future, prefix, index in tasks:
+                    self._discard((blocks, future, len(chunks[index])))
+        return lost
+
+    def _finish(self, task, chunks, results, lost, errors):
+        blocks, future, prefix, index = task
+        error = future.exception()
+        if isinstance(error, BrokenProcessPool):
+            self._lost(blocks, prefix, len(chunks[index]))
+            lost.append((index, error))
+        else:
+            results[index] = self._collect((blocks, future, len(chunks[index])), errors)
+
+    def _run_alone(self, function, image, errors, retries):
+        # images of tasks lost when a pool broke run again one at a time in their own process,
+        # so a crash is attributed to the right image. Each crash counts as an attempt
+        for attempt in range(1, retries + 2):
+            results = [None]
+            lost = self._run_pool(
+                function, [[image]], deque([0]), results, errors, 1, 1
+            )
+            if not lost:
+                return results[0][0]
+        if errors == "raise":
+            raise lost[0][1]
+        return ImageFailure(lost[0][1], attempts=attempt)
+
+    def _map_chunks(self, function, chunks, errors, retries=0):
+        self._start_tracker()
+        results = [None] * len(chunks)
+        queue = deque(range(len(chunks)))
+        while queue:
+            # after a crash the remaining chunks go to a fresh pool
+            lost = self._run_pool(
+                function, chunks, queue, results, errors, self.workers, 2 * self.workers
+            )
+            for index, _ in lost:
+                results[index] = [
+                    self._run_alone(function, image, errors, retries)
+                    for image in chunks[index]
+                ]
+        return results
+
+    def imap(
+        self,
+        operation,
+        images,
+        in_flight=None,
+        ordered=False,
+        errors="raise",
+        retries=0,
+    ):
+        check_error_policy(errors)
+        self._start_tracker()
+        function = guard(partial(_apply_image, operation), errors, retries)
+        tasks = {}
+        pools = [_ProcessPool(max_workers=self.workers)]
+
+        def submit(image):
+            try:
+                blocks, future, prefix = self._submit(pools[-1], function, [image])
+            except BrokenProcessPool:
+                # a worker crashed, the remaining images go to a fresh pool
+                pools.append(_ProcessPool(max_workers=self.workers))
+                blocks, future, prefix = self._submit(pools[-1], function, [image])
+            tasks[future] = (blocks, prefix, image)
+            return future
+
+        def result(future):
+            blocks, prefix, image = tasks.pop(future)
+            if isinstance(future.exception(), BrokenProcessPool):
+                self._lost(blocks, prefix, 1)
+                return self._run_alone(function, image, errors, retries)
+            return self._collect((blocks, future, 1), errors)[0]
+
+        try:
+            yield from _stream(
+                submit,
+                _wait_futures,
+                result,
+                images,
+                in_flight or 2 * self.workers,
+                ordered,
+            )
+        finally:
+            for future, (blocks, prefix, image) in tasks.items():
+                if isinstance(future.exception(), BrokenProcessPool):
+                    self._lost(blocks, prefix, 1)
+                else:
+                    self._discard((blocks, future, 1))
+            for pool in pools:
+                pool.shutdown()
+
+
+class RayExecutor(Executor):
+    """
+    Executor that processes images with `ray <https://ray.io/>`_, locally or in a cluster. The \
+    local cluster is started if needed (see :meth:`start`).
+
+    The operation and the data of each loaded image are put in the object store once, as \
+    contiguous arrays that workers read without copying. Images that are results of a previous \
+    parallel operation are sent as references (their data never goes through the driver). \
+    Resulting images are lazy images that reference the results in the object store, they \
+    are only fetched when used. If `retries` is given, ray also retries the tasks lost because \
+    a worker crashed.
+
+    Images that are not loaded (lazy **lists** created from folders, paths or links) are sent \
+    as their paths, each worker opens its own images and the driver never decodes them (the \
+    size of the chunks is measured with a first task). With an `output` folder (on a \
+    filesystem shared by all nodes) workers also write the resulting images there and only \
+    their paths are returned, as lazy images. Images are named after their index in the \
+    **list**.
+
+    :param output: Folder where workers write the resulting images, defaults to None (results \
+    are kept in the object store)
+    :type output: :class:`str`, optional
+    :param format: File format of the written images, defaults to png
+    :type format: :class:`str`, optional
+    :param quality: Quality of jpeg/webp images (0-100), defaults to the OpenCV default
+    :type quality: :class:`int`, optional
+    :param compression: Compression level of png images (0-9), defaults to the OpenCV default
+    :type compression: :class:`int`, optional
+    """
+
+    def __init__(self, output=None, format="png", quality=None, compression=None):
+        self.output = None
+        if output is not None:
+            self.output = {
+                "folder": os.path.abspath(str(output)),
+                "format": format.lower().lstrip("."),
+                "quality": quality,
+                "compression": compression,
+            }
+
+    @staticmethod
+    def start():
+        """
+        Starts the local cluster if ray isn't initialized yet.
+        """
+        import ray
+
+        if not ray.is_initialized():
+            ray.init(logging_level=40)
+
+    @property
+    def workers(self):
+        import ray
+
+        self.start()
+        return max(1, int(ray.cluster_resources().get("CPU", 1)))
+
+    def _map_chunks(self, function, chunks, errors, retries=0):
+        import ray
+
+        self.start()
+        tasks = [_remote(_map_chunk).remote(function, chunk) for chunk in chunks]
+        if errors == "raise":
+            return ray.get(tasks)
+
+        results = []
+        for task, chunk in zip(tasks, chunks):
+            try:
+                results.append(ray.get(task))
+            except Exception as error:
+                results.append([ImageFailure(error) for _ in chunk])
+        return results
+
+    def _submit(self, operation, chunk, names, errors, retries):
+        import ray
+
+        images, loaded, arrays = [], [], []
+        for image in chunk:
+            loaded.append(image.loaded)
+            if image.loaded:
+                arrays.append(ray.put(np.ascontiguousarray(image._img)))
+                image = copy(image)
+                image._img = None
+            images.append(image)
+
+        options = {"num_returns": len(chunk) + 1}
+        if retries:
+            options["max_retries"] = retries
+        task = _remote(_ray_chunk).options(**options)
+        references = task.remote(
+            operation, images, loaded, errors, retries, self.output, names, *arrays
+        )
+        return references[:-1], references[-1]
+
+    @staticmethod
+    def _failures(status, count, errors):
+        # failures of a task as {position: record}
+        import ray
+
+        if errors == "raise":
+            # raises the error of the task (the outputs would only fail when used)
+            ray.get(status)
+            return {}
+        try:
+            return dict(ray.get(status)[0])
+        except Exception as error:
+            return {position: ImageFailure(error) for position in range(count)}
+
+    def _results(self, references, outputs, failures):
+        import ray
+
+        references = [r for p, r in enumerate(references) if p not in failures]
+        if outputs != {}:
+            values = ray.get(references)
+        elif self.output is not None:
+            # paths of the images written by the workers
+            values = [easycv.image.Image(f, lazy=True) for f in ray.get(references)]
+        else:
+            values = [easycv.image.Image(r, lazy=True) for r in references]
+
+        values = iter(values)
+        return [
+            failures[p] if p in failures else next(values)
+            for p in range(len(references) + len(failures))
+        ]
+
+    def _run(self, operation, images, chunk_size, errors, retries):
+        import ray
+
+        check_error_policy(errors)
+        self.start()
+        outputs = {} if operation is None else operation.outputs
+        if operation is not None:
+            operation = ray.put(_contiguous(operation))
+
+        images = list(images)
+        tasks = []
+        if chunk_size is None and images:
+            # the cost is measured by the worker of a first task, so the driver doesn't open any
+            # image and the overhead of the task isn't counted
+            tasks.append(self._submit(operation, images[:1], [0], errors, retries))
+            try:
+                cost = ray.get(tasks[0][1])[1]
+            except Exception:
+                if errors == "raise":
+                    raise
+                cost = 0  # the task was lost, the failure is reported with the results
+            chunk_size = auto_chunk_size(cost, len(images) - 1, self.workers)
+        for offset in range(len(tasks), len(images), chunk_size or 1):
+            chunk = images[offset : offset + (chunk_size or 1)]
+            names = list(range(offset, offset + len(chunk)))
+            tasks.append(self._submit(operation, chunk, names, errors, retries))
+
+        results = []
+        for references, status in tasks:
+            failures = self._failures(status, len(references), errors)
+            results.extend(self._results(references, outputs, failures))
+        return results
+
+    def apply(self, operation, images, chunk_size=None, errors="raise", retries=0):
+        return self._run(operation, images, chunk_size, errors, retries)
+
+    def compute(self, images, chunk_size=None, errors="raise", retries=0):
+        return self._run(None, images, chunk_size, errors, retries)
+
+    def imap(
+        self,
+        operation,
+        images,
+        in_flight=None,
+        ordered=False,
+        errors="raise",
+        retries=0,
+    ):
+        import ray
+
+        check_error_policy(errors)
+        self.start()
+        outputs = operation.outputs
+        reference = ray.put(_contiguous(operation))
+        statuses = {}
+        names = itertools.count()  # images are submitted in order
+
+        def submit(image):
+            references, status = self._submit(
+                reference, [image], [next(names)], errors, retries
+            )
+            statuses[references[0]] = status
+            return references[0]
+
+        def result(task):
+            failures = self._failures(statuses.pop(task), 1, errors)
+            return self._results([task], outputs, failures)[0]
+
+        yield from _stream(
+            submit,
+            lambda tasks: ray.wait(tasks, num_returns=1)[0],
+            result,
+            images,
+            in_flight or 2 * self.workers,
+            ordered,
+        )
+
+
+EXECUTORS = {
+    "serial": SerialExecutor,
+    "threads": ThreadExecutor,
+    "processes": ProcessExecutor,
+    "ray": RayExecutor,
+}
+
+
+def get_executor(executor):
+    """
+    Returns an executor given its name ("serial", "threads", "processes" or "ray"). `True` \
+    selects ray (the default parallel backend). Executor instances are returned as they are.
+
+    :param executor: Name of the executor, `True` or an executor
+    :type executor: :class:`str`/:class:`bool`/:class:`Executor`
+    :return: The executor
+    :rtype: :class:`Executor`
+    """
+    if isinstance(executor, Executor):
+        return executor
+    if executor is True:
+        executor = "ray"
+    if executor not in EXECUTORS:
+        raise ValueError(
+            "Unknown executor {}, use one of {}".format(executor, ", ".join(EXECUTORS))
+        )
+    return EXECUTORS[executor]()
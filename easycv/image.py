@@ -5,14 +5,63 @@ import json
 
 import numpy as np
 
-from easycv.collection import Collection, auto_compute
+from easycv.collection import Collection, auto_compute, run_in_executor
 from easycv.errors.io import InvalidImageInputSource
 from easycv.io import save, valid_image_source, get_image_array, show, random_dog_image
+from easycv.io import open_image, probe_image
+from easycv.io.codec import encode_image, decode_image
 from easycv.output import Output
+from easycv.pipeline import Pipeline
 from easycv.transforms.base import Transform
+from easycv.transforms.spatial import Resize, Rescale
 import cv2
 
 
+def _open_reduced(path, pending):
+    """
+    Decodes a local JPEG whose first pending transform is a Resize/Rescale at a reduced \
+    resolution (1/2, 1/4 or 1/8, never smaller than the target size), which is several times \
+    faster and uses less memory than decoding the full image. The resize is still applied to the \
+    reduced image so the output size is exactly the same. The result differs slightly from \
+    resizing the full image: the mean absolute difference is typically below 1 intensity level \
+    and isolated pixels on sharp edges can differ up to ~5% of the range. Returns the image and \
+    the pipeline still to be applied or `None` if the image can't be decoded at a reduced \
+    resolution.
+    """
+    transform = pending.transforms()[0]
+    if not os.path.isfile(path):
+        return None
+
+    probe = probe_image(path)
+    if probe is None or probe[2] != "JPEG":
+        return None
+
+    width, height = probe[:2]
+    args = transform.args
+    if isinstance(transform, Resize):
+        target = (args["width"], args["height"])
+    else:
+        target = (int(round(width * args["fx"])), int(round(height * args["fy"])))
+
+    reductions = [
+        r for r in (8, 4, 2) if width // r >= target[0] and height // r >= target[1]
+    ]
+    if not reductions:
+        return None
+    image = open_image(path, reduce=reductions[0])
+    if image is None:
+        return None
+
+    if isinstance(transform, Rescale):
+        # the scale factors refer to the full image, resize to the exact target size instead
+        method = args["method"]
+        if method == "auto":
+            method = "cubic" if args["fx"] * args["fy"] > 1 else "area"
+        resize = Resize(width=target[0], height=target[1], method=method)
+        pending = Pipeline([resize] + pending.transforms()[1:], name="pending")
+    return image, pending
+
+
 class Image(Collection):
     """
     This class represents an image.
@@ -45,6 +94,44 @@ class Image(Collection):
             self._img = self._pending(get_image_array(source))["image"]
             self._pending.clear()
 
+    @classmethod
+    def _wrap(cls, array):
+        """
+        Creates a (non lazy) **image** that uses the given array without copying it. The array \
+        must not be used anywhere else.
+        """
+        if not valid_image_source(array):
+            raise InvalidImageInputSource()
+
+        image = cls.__new__(cls)
+        Collection.__init__(image)
+        image._img = array
+        return image
+
+    @classmethod
+    async def open_async(cls, source, pipeline=None, lazy=False, executor=None):
+        """
+        Asynchronous version of the **image** constructor. Downloading/decoding the image and \
+        applying the pipeline run in an executor, so the event loop isn't blocked.
+
+        :param source: Image data source. An array representing the image or a path/link to a \
+        file containing the image
+        :type source: :class:`str`/:class:`~numpy:numpy.ndarray`
+        :param pipeline: Pipeline to be applied to the image at creation time, defaults to None
+        :type pipeline: :class:`~easycv.pipeline.Pipeline`, optional
+        :param lazy: `True` if the image is lazy, defaults to False
+        :type lazy: :class:`boolean`, optional
+        :param executor: Executor to use, defaults to the event loop default executor
+        :type executor: :class:`~concurrent.futures.Executor`, optional
+        :return: The new image
+        :rtype: :class:`Image`
+        """
+        if lazy:
+            return cls(source, pipeline=pipeline, lazy=True)
+        return await run_in_executor(
+            cls, source, pipeline=pipeline, lazy=lazy, executor=executor
+        )
+
     @classmethod
     def random(cls, lazy=False):
         """
@@ -66,42 +153,60 @@ class Image(Collection):
         """
         return self._img is not None
 
+    def _shape(self):
+        # lazy images whose pending transforms keep the shape don't need to be decoded/computed
+        if self._lazy and not self.loaded and self._pending.preserves_shape:
+            if isinstance(self._source, np.ndarray):
+                return self._source.shape
+            if (
+                isinstance(self._source, str)
+                and os.path.isfile(self._source)
+                and cv2.haveImageReader(self._source)
+            ):
+                probe = probe_image(self._source)
+                if probe is not None:
+                    return probe[1], probe[0], 3  # images are always decoded in color
+
+        self.compute(in_place=True)
+        return self._img.shape
+
     @property
-    @auto_compute
     def height(self):
         """
-        Returns image height.
+        Returns image height. For lazy images from files, if no pending transform changes \
+        the shape, the height is read from the file header (the image isn't decoded).
 
         :return: Image height
         :rtype: :class:`int`
         """
-        return self._img.shape[0]
+        return self._shape()[0]
 
     @property
-    @auto_compute
     def width(self):
         """
-        Returns **image** width.
+        Returns **image** width. For lazy images from files, if no pending transform changes \
+        the shape, the width is read from the file header (the image isn't decoded).
 
         :return: Image width
         :rtype: :class:`int`
         """
-        return self._img.shape[1]
+        return self._shape()[1]
 
     @property
-    @auto_compute
     def channels(self):
         """
-        Returns **image** number of channels.
+        Returns **image** number of channels. For lazy images from files, if no pending \
+        transform changes the shape, the image isn't decoded (images are always decoded with 3 \
+        channels).
 
         :return: Image numeber of channels
         :rtype: :class:`int`
         """
-
-        if len(self._img.shape) == 2:
+        shape = self._shape()
+        if len(shape) == 2:
             return 1
         else:
-            return self._img.shape[2]
+            return shape[2]
 
     @property
     @auto_compute
@@ -121,6 +226,29 @@ class Image(Collection):
         if not self.loaded:
             self._img = get_image_array(self._source)
 
+    async def load_async(self, executor=None):
+        """
+        Asynchronous version of :meth:`load`, the image is downloaded/decoded in an executor.
+
+        :param executor: Executor to use, defaults to the event loop default executor
+        :type executor: :class:`~concurrent.futures.Executor`, optional
+        """
+        if not self.loaded:
+            await run_in_executor(self.load, executor=executor)
+
+    def _open_source(self):
+        # leading resizes of local JPEG files are done while decoding (see _open_reduced)
+        transforms = self._pending.transforms()
+        if (
+            isinstance(self._source, str)
+            and transforms
+            and isinstance(transforms[0], (Resize, Rescale))
+        ):
+            reduced = _open_reduced(self._source, self._pending)
+            if reduced is not None:
+                return reduced
+        return get_image_array(self._source), self._pending
+
     def apply(self, transform, in_place=False):
         """
         Returns a new **image** with the :doc:`transform <transforms/index>` or \
@@ -160,10 +288,15 @@ class Image(Collection):
             self.load()
             if outputs == {}:  # If transform outputs an image
                 if in_place:
+                    if transform.modifies_input and not self._img.flags.writeable:
+                        self._img = self._img.copy()
                     self._img = transform(self._img)["image"]
                 else:
-                    new_image = transform(self._img.copy())["image"]
-                    return Image(new_image)
+                    source = self._img.copy() if transform.modifies_input else self._img
+                    new_image = transform(source)["image"]
+                    if np.may_share_memory(new_image, self._img):
+                        new_image = new_image.copy()
+                    return Image._wrap(new_image)
             else:
                 return transform(self._img)
 
@@ -171,7 +304,8 @@ class Image(Collection):
         """
         Returns a new **image** with all the pending operations applied.
         If `in_place` is *True* the pending operations will be applied
-        to the current **image** instead.
+        to the current **image** instead. If `in_place` is *False* and the current **image** \
+        isn't loaded it stays unloaded.
 
         :param in_place: `True` to change the current **image**, `False` to return a new one with \
          the pending transforms applied, defaults to `True`
@@ -179,48 +313,93 @@ class Image(Collection):
         :return: The new **image** if `in_place` is *False*
         :rtype: :class:`~eascv.image.Image`
         """
-        self.load()
         if in_place:
-            self._img = self._pending(self._img)["image"]
+            if self.loaded:
+                source, pending = self._img, self._pending
+            else:
+                source, pending = self._open_source()
+            if pending.modifies_input and not source.flags.writeable:
+                source = source.copy()
+            self._img = pending(source)["image"]
             self._pending.clear()
             return self
         else:
-            result = Image(self._pending(self._img)["image"], lazy=self._lazy)
-            return result
+            output = self._computed_array()
+            if self._lazy:
+                return Image(output, lazy=True)
+            return Image._wrap(output)
 
-    @auto_compute
-    def encode(self):
+    async def compute_async(self, in_place=True, executor=None):
+        """
+        Asynchronous version of :meth:`compute`, loading the image and applying the pending \
+        operations run in an executor.
+
+        :param in_place: `True` to change the current **image**, `False` to return a new one with \
+         the pending transforms applied, defaults to `True`
+        :type in_place: :class:`bool`, optional
+        :param executor: Executor to use, defaults to the event loop default executor
+        :type executor: :class:`~concurrent.futures.Executor`, optional
+        :return: The computed **image**
+        :rtype: :class:`~eascv.image.Image`
         """
-        Returns a encoded version of the **image**
+        return await run_in_executor(self.compute, in_place=in_place, executor=executor)
+
+    def _computed_array(self):
+        # the decoded image is not kept, so computing copies doesn't grow the memory usage
+        pending = self._pending
+        if self.loaded:
+            source = self._img.copy() if pending.modifies_input else self._img
+        else:
+            source, pending = self._open_source()
+            if pending.modifies_input and not source.flags.writeable:
+                source = source.copy()
 
+        output = pending(source)["image"]
+        if self.loaded and np.may_share_memory(output, self._img):
+            output = output.copy()
+        return output
+
+    @auto_compute
+    def encode(self, format="raw", quality=None):
+        """
+        Returns a binary encoded version of the **image** (a fixed size header followed by the \
+        raw image data or the image compressed with PNG, JPEG or WebP). See \
+        :func:`~easycv.io.codec.encode_image`.
+
+        :param format: Format of the image data (raw, png, jpeg or webp), defaults to raw
+        :type format: :class:`str`, optional
+        :param quality: Quality of the compression (jpeg/webp: 0-100) or compression level \
+        (png: 0-9), defaults to the OpenCV default
+        :type quality: :class:`int`, optional
         :return: Encoded image
-        :rtype: :class:`str`
-        """
-        image_data = base64.b64encode(self.array.copy(order="C")).decode("utf-8")
-        encoded = {
-            "width": self.width,
-            "height": self.height,
-            "channels": self.channels,
-            "dtype": str(self.array.dtype),
-            "data": image_data,
-        }
-        return json.dumps(encoded)
+        :rtype: :class:`bytes`
+        """
+        return encode_image(self._img, format=format, quality=quality)
 
     @classmethod
     def decode(cls, encoded):
         """
-        Creates an image by decoding a previously encoded encoded image.
+        Creates an image by decoding a previously encoded encoded image. Raw encoded images are \
+        not copied, the image uses the given buffer. Images encoded as JSON strings (by previous \
+        versions) are also supported.
 
+        :param encoded: Encoded image
+        :type encoded: :class:`bytes`/:class:`bytearray`/:class:`memoryview`/:class:`str`
         :return: Decoded image
         :rtype: :class:`~eascv.image.Image`
         """
-        encoded = json.loads(encoded)
-        shape = (encoded["height"], encoded["width"], encoded["channels"])
-        image_data = bytes(encoded["data"], encoding="utf-8")
-        image_array = np.frombuffer(
-            base64.decodebytes(image_data), dtype=encoded["dtype"]
-        )
-        return cls(image_array.reshape(shape))
+        if isinstance(encoded, str):
+            encoded = json.loads(encoded)
+            shape = (encoded["height"], encoded["width"])
+            if encoded["channels"] != 1:
+                shape += (encoded["channels"],)
+            image_data = bytes(encoded["data"], encoding="utf-8")
+            image_array = np.frombuffer(
+                base64.decodebytes(image_data), dtype=encoded["dtype"]
+            )
+            return cls._wrap(image_array.reshape(shape))
+
+        return cls._wrap(decode_image(encoded))
 
     @auto_compute
     def show(self, name="Image"):
@@ -1,19 +1,39 @@
-from easycv.io.output import save, show, show_grid
+from easycv.io.output import encode, save, show, show_grid, write_image
+from easycv.io.codec import encode_image, decode_image
+from easycv.io.container import is_container, read_container, write_container
+from easycv.io.fetch import configure_http, random_dog_images
 from easycv.io.input import (
     open_image,
+    open_images,
+    probe_image,
     valid_image_source,
     get_image_array,
     random_dog_image,
     get_image_list,
+    get_image_paths,
+    is_object_ref,
 )
 
 __all__ = [
+    "configure_http",
+    "decode_image",
+    "encode",
+    "encode_image",
     "get_image_array",
     "open_image",
+    "open_images",
+    "probe_image",
+    "random_dog_images",
     "random_dog_image",
     "save",
     "show",
     "show_grid",
     "valid_image_source",
     "get_image_list",
+    "get_image_paths",
+    "is_container",
+    "is_object_ref",
+    "read_container",
+    "write_container",
+    "write_image",
 ]
@@ -0,0 +1,93 @@
+import struct
+
+import cv2
+import numpy as np
+
+from easycv.errors.io import ImageDecodeError
+from easycv.io.output import encode
+
+MAGIC = b"ECVI"
+VERSION = 1
+CODECS = {"raw": 0, "png": 1, "jpeg": 2, "webp": 3}
+
+# magic, version, codec, channels, (padding), height, width, dtype
+_header = struct.Struct("<4sBBBxII8s")
+
+
+def encode_image(image_array, format="raw", quality=None):
+    """
+    Encodes an image into bytes. The encoded image starts with a fixed size header (magic, \
+    version, codec, channels, height, width and data type) followed by the raw image data or \
+    the image compressed with PNG, JPEG or WebP (see :func:`~easycv.io.output.encode`).
+
+    :param image_array: Image as an array
+    :type image_array: :class:`~numpy:numpy.ndarray`
+    :param format: Format of the image data (raw, png, jpeg or webp), defaults to raw
+    :type format: :class:`str`, optional
+    :param quality: Quality of the compression (jpeg/webp: 0-100) or compression level (png: \
+    0-9), defaults to the OpenCV default
+    :type quality: :class:`int`, optional
+    :return: Encoded image
+    :rtype: :class:`bytes`
+    """
+    if format not in CODECS:
+        raise ValueError("Unsupported format {}".format(format))
+
+    channels = 1 if len(image_array.shape) == 2 else image_array.shape[2]
+    header = _header.pack(
+        MAGIC,
+        VERSION,
+        CODECS[format],
+        channels,
+        image_array.shape[0],
+        image_array.shape[1],
+        image_array.dtype.str.encode("ascii"),
+    )
+
+    if format == "raw":
+        return b"".join((header, np.ascontiguousarray(image_array).data))
+
+    if format == "png":
+        data = encode(image_array, format, compression=quality)
+    else:
+        data = encode(image_array, format, quality=quality)
+    return b"".join((header, data))
+
+
+def decode_image(encoded):
+    """
+    Decodes an image encoded with :func:`encode_image`. Raw images are returned as a view of \
+    the given buffer (no copy), so the array is read-only if the buffer is read-only (e.g. \
+    :class:`bytes`).
+
+    :param encoded: Encoded image
+    :type encoded: :class:`bytes`/:class:`bytearray`/:class:`memoryview`
+    :return: Image as an array
+    :rtype: :class:`~numpy:numpy.ndarray`
+    """
+    try:
+        magic, version, codec, channels, height, width, dtype = _header.unpack_from(
+            encoded
+        )
+    except struct.error:
+        raise ImageDecodeError("Encoded image is too short") from None
+
+    if magic != MAGIC or version != VERSION or codec not in CODECS.values():
+        raise ImageDecodeError("Invalid encoded image")
+
+    shape = (height, width) if channels == 1 else (height, width, channels)
+    dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+
+    if codec == CODECS["raw"]:
+        count = height * width * channels
+        try:
+            image = np.frombuffer(encoded, dtype, count=count, offset=_header.size)
+        except ValueError:
+            raise ImageDecodeError("Encoded image data is incomplete") from None
+        return image.reshape(shape)
+
+    data = np.frombuffer(encoded, "uint8", offset=_header.size)
+    image = cv2.imdecode(data, cv2.IMREAD_UNCHANGED)
+    if image is None or image.shape != shape:
+        raise ImageDecodeError("Failed to decode image data")
+    return image
@@ -0,0 +1,90 @@
+import json
+import struct
+
+import numpy as np
+
+from easycv.errors.io import InvalidContainerError
+
+MAGIC = b"EASYCVL1"
+ALIGNMENT = 64  # Start of each image data (in bytes), keeps every image aligned for SIMD
+_footer = struct.Struct("<Q8s")  # Offset of the index + magic
+
+
+def _padding(position):
+    return -position % ALIGNMENT
+
+
+def is_container(path):
+    """
+    Returns `True` if a file is an image container (created with :func:`write_container`).
+
+    :param path: Path to a file
+    :type path: :class:`str`
+    :return: `True` if the file is a container, otherwise `False`
+    :rtype: :class:`bool`
+    """
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_container(filename, arrays):
+    """
+    Writes images to a container file. The container stores the raw data of each image \
+    (contiguous and aligned) followed by an index with the position, shape and type of each \
+    image, so images can be written one at a time and reopened without decoding.
+
+    Layout: magic (8 bytes) | image data (each one aligned to 64 bytes) | index (JSON) | index \
+    offset (8 bytes) | magic (8 bytes)
+
+    :param filename: Name of the container file
+    :type filename: :class:`str`
+    :param arrays: Iterable with the images (as arrays) to store
+    :type arrays: :class:`iterable`
+    """
+    index = []
+    with open(filename, "wb") as f:
+        f.write(MAGIC)
+        position = len(MAGIC)
+        for array in arrays:
+            array = np.ascontiguousarray(array)
+            padding = _padding(position)
+            f.write(b"\0" * padding)
+            position += padding
+
+            index.append(
+                {"offset": position, "shape": list(array.shape), "dtype": array.dtype.str}
+            )
+            f.write(array.data)
+            position += array.nbytes
+
+        f.write(json.dumps({"images": index}).encode("utf-8"))
+        f.write(_footer.pack(position, MAGIC))
+
+
+def read_container(filename):
+    """
+    Opens a container file (created with :func:`write_container`) using a memory map. Images \
+    are returned as views of the file (no data is read until the images are used). Changes to \
+    the arrays are never written to the file.
+
+    :param filename: Name of the container file
+    :type filename: :class:`str`
+    :return: List with the images as arrays
+    :rtype: :class:`list`
+    """
+    if not is_container(filename):
+        raise InvalidContainerError()
+
+    data = np.memmap(filename, dtype="uint8", mode="c")
+    index_offset, magic = _footer.unpack(data[-_footer.size :].tobytes())
+    if magic != MAGIC:
+        raise InvalidContainerError()
+    index = json.loads(data[index_offset : -_footer.size].tobytes().decode("utf-8"))
+
+    return [
+        np.ndarray(image["shape"], image["dtype"], buffer=data, offset=image["offset"])
+        for image in index["images"]
+    ]
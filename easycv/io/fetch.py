@@ -0,0 +1,117 @@
+import json
+import threading
+
+from easycv.errors.io import ImageDownloadError, InvalidPathError
+
+DOG_API = "https://dog.ceo/api/breeds/image/random/{}"
+DOG_API_LIMIT = 50  # Maximum number of images returned by a single request
+
+_lock = threading.Lock()
+_session = None
+_settings = {"workers": 8, "timeout": (5, 30), "retries": 3}
+
+
+def configure_http(workers=None, timeout=None, retries=None):
+    """
+    Configures how images are downloaded. Downloads share a pool of keep-alive connections, \
+    failed requests (connection errors or 429/5xx responses) are retried with backoff.
+
+    :param workers: Maximum number of concurrent downloads (and pooled connections per host), \
+    defaults to 8
+    :type workers: :class:`int`, optional
+    :param timeout: Timeout in seconds, a single value or a (connect, read) tuple, defaults \
+    to (5, 30)
+    :type timeout: :class:`float`/:class:`tuple`, optional
+    :param retries: Number of retries of each request, defaults to 3
+    :type retries: :class:`int`, optional
+    """
+    global _session
+    with _lock:
+        settings = {"workers": workers, "timeout": timeout, "retries": retries}
+        for name, value in settings.items():
+            if value is not None:
+                _settings[name] = value
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def http_workers():
+    """
+    Returns the maximum number of concurrent downloads.
+
+    :return: Maximum number of concurrent downloads
+    :rtype: :class:`int`
+    """
+    return _settings["workers"]
+
+
+def get_session():
+    """
+    Returns the HTTP session used to download images (created on first use).
+
+    :return: HTTP session
+    :rtype: :class:`requests.Session`
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=_settings["retries"],
+                backoff_factor=0.2,
+                status_forcelist=(429, 500, 502, 503, 504),
+            )
+            adapter = HTTPAdapter(
+                pool_connections=_settings["workers"],
+                pool_maxsize=_settings["workers"],
+                max_retries=retry,
+            )
+            _session = requests.Session()
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def fetch(url):
+    """
+    Downloads the content of an url using the shared connection pool.
+
+    :param url: Url to download
+    :type url: :class:`str`
+    :return: Downloaded content
+    :rtype: :class:`bytes`
+    """
+    import requests
+
+    try:
+        response = get_session().get(url, timeout=_settings["timeout"])
+    except requests.exceptions.RequestException:
+        raise InvalidPathError("File path is invalid.") from None
+
+    if response.status_code != 200:
+        raise ImageDownloadError(
+            "Failed to Download file, error {}.".format(response.status_code)
+        )
+    return response.content
+
+
+def random_dog_images(n):
+    """
+    Makes requests to `DogApi <https://dog.ceo/dog-api/>`_ for `n` random images (a single \
+    request returns up to 50 links) and extracts the links from the responses.
+
+    :param n: Number of images
+    :type n: :class:`int`
+    :return: Links to random dog images
+    :rtype: :class:`list`
+    """
+    links = []
+    while len(links) < n:
+        count = min(n - len(links), DOG_API_LIMIT)
+        response = json.loads(fetch(DOG_API.format(count)).decode("utf-8"))
+        links.extend(response["message"])
+    return links
@@ -1,13 +1,22 @@
 import os
-
-from urllib.error import URLError
-from urllib.request import urlopen
-from json import loads
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import cv2
 import numpy as np
 
-from easycv.errors.io import ImageDownloadError, InvalidPathError
+from easycv.errors.io import ImageDecodeError, InvalidPathError
+from easycv.io.fetch import fetch, http_workers, random_dog_images
+
+REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# EXIF orientations that rotate the image by 90 degrees (OpenCV applies them when decoding)
+_transposed_orientations = (5, 6, 7, 8)
 
 
 def valid_image_array(image_array):
@@ -26,47 +35,123 @@ def valid_image_array(image_array):
     return source_is_grayscale or source_is_color
 
 
+def is_object_ref(source):
+    """
+    Returns `True` if a source is a ray object reference (ray isn't imported).
+
+    :param source: Source of an image
+    :return: Returns `True` if the source is an object reference, otherwise `False`
+    :rtype: :class:`bool`
+    """
+    return type(source).__name__ == "ObjectRef"
+
+
 def valid_image_source(source):
     """
     Returns `True` if a source is valid
-    A source is valid if it is a string or a :class:`~numpy:numpy.ndarray`
+    A source is valid if it is a string, a :class:`~numpy:numpy.ndarray` or a ray object \
+    reference (to an array in the object store)
 
     :param source: Source of an image
-    :type source: :class:`str`/:class:`~numpy:numpy.ndarray`
+    :type source: :class:`str`/:class:`~numpy:numpy.ndarray`/:class:`ray.ObjectRef`
     :return: Returns `True` if a source is valid, otherwise `False`
     :rtype: :class:`bool`
     """
     source_is_str = isinstance(source, str)
     source_is_array = isinstance(source, np.ndarray)
-    return source_is_str or (source_is_array and valid_image_array(source))
+    return (
+        source_is_str
+        or (source_is_array and valid_image_array(source))
+        or is_object_ref(source)
+    )
 
 
-def open_image(path):
+def open_image(path, reduce=1):
     """
     Opens/Downloads an image and reads it into an array
 
     :param path: Path/Link to an image
     :type path: :class:`str`
+    :param reduce: Decode local images at a reduced resolution (1, 2, 4 or 8 times smaller), \
+    defaults to 1 (full resolution)
+    :type reduce: :class:`int`, optional
     :return: Image as an array
     :rtype: :class:`~numpy:numpy.ndarray`
     """
+    if os.path.isfile(path):
+        return cv2.imread(path, REDUCED_FLAGS[reduce])
+
+    img = np.frombuffer(fetch(path), dtype="uint8")
+    img = cv2.imdecode(img, cv2.IMREAD_COLOR)
+    if not isinstance(img, np.ndarray):
+        raise InvalidPathError("The given path is not an image.")
+    return img
+
+
+def open_images(paths, workers=None):
+    """
+    Opens/Downloads several images concurrently (downloads share a pool of connections, see \
+    :func:`~easycv.io.fetch.configure_http`). The arrays are in the same order as the paths.
+
+    :param paths: Paths/Links to images
+    :type paths: :class:`list`
+    :param workers: Maximum number of images opened at the same time, defaults to the \
+    configured number of concurrent downloads
+    :type workers: :class:`int`, optional
+    :return: Images as arrays
+    :rtype: :class:`list`
+    """
+    with ThreadPoolExecutor(max_workers=workers or http_workers()) as executor:
+        return list(executor.map(open_image, paths))
+
+
+def _open_header(path):
+    # Image.open refuses images with more pixels than Image.MAX_IMAGE_PIXELS (and warns above
+    # half of it), which protects decoding. Only the header is read here, so the plugins are
+    # used directly for the images it refuses
+    from PIL import Image
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+            return Image.open(path)
+    except Image.DecompressionBombError:
+        pass
+
+    Image.init()
+    with open(path, "rb") as f:
+        prefix = f.read(16)
+    for factory, accept in Image.OPEN.values():
+        if accept is None or accept(prefix):
+            try:
+                return factory(path)
+            except (SyntaxError, OSError, ValueError, IndexError, TypeError):
+                continue
+    raise OSError("Unknown image format")
+
+
+def probe_image(path):
+    """
+    Reads the size and format of a local image file from its header (the image isn't decoded). \
+    The size is the size of the image decoded by OpenCV (the EXIF orientation is applied).
+
+    :param path: Path to an image file
+    :type path: :class:`str`
+    :return: Width, height and format (e.g. "JPEG") of the image or `None` if the file can't be \
+    read
+    :rtype: :class:`tuple`
+    """
     try:
-        if os.path.isfile(path):
-            img = cv2.imread(path)
-        else:
-            response = urlopen(path)
-            if response.getcode() != 200:
-                raise ImageDownloadError(
-                    "Failed to Download file, error {}.".format(response.getcode())
-                )
-            img = np.asarray(bytearray(response.read()), dtype="uint8")
-            img = cv2.imdecode(img, cv2.IMREAD_COLOR)
-            if not isinstance(img, np.ndarray):
-                raise InvalidPathError("The given path is not an image.")
-        return img
-
-    except URLError:
-        raise InvalidPathError("File path is invalid.") from None
+        with _open_header(path) as image:
+            width, height = image.size
+            orientation = image.getexif().get(0x0112, 1)
+            image_format = image.format
+    except (OSError, ValueError):
+        return None
+
+    if orientation in _transposed_orientations:
+        width, height = height, width
+    return width, height, image_format
 
 
 def random_dog_image():
@@ -77,56 +162,96 @@ def random_dog_image():
     :return: Link to a random dog image
     :rtype: :class:`str`
     """
-    response = urlopen("https://dog.ceo/api/breeds/image/random")
-    if response.getcode() != 200:
-        raise ImageDownloadError(
-            "Failed to Download file, error {}.".format(response.getcode())
-        )
-    buf = response.read()
-    result = loads(buf.decode("utf-8"))
-    return result["message"]
+    return random_dog_images(1)[0]
 
 
 def get_image_array(image_source):
     """
-    :param image_source: Path/Link to an image or an array of an image
-    :type image_source: :class:`~numpy:numpy.ndarray`/:class:`str`
+    :param image_source: Path/Link to an image, an array of an image or a ray object reference \
+    to an array (returned without copying, the array is read-only)
+    :type image_source: :class:`~numpy:numpy.ndarray`/:class:`str`/:class:`ray.ObjectRef`
     :return: image as an array
     :rtype: :class:`~numpy:numpy.ndarray`
     """
     if isinstance(image_source, str):
         return open_image(image_source)
+    elif is_object_ref(image_source):
+        import ray
+
+        return ray.get(image_source)
     else:
         return np.copy(image_source)
 
 
-def open_folder(list_source, recursive=False):
+def _folder_files(list_source, recursive=False):
+    if not recursive:
+        return [os.path.join(list_source, fn) for fn in next(os.walk(list_source))[2]]
+
+    paths = []
+    for root, _, files in os.walk(list_source):
+        for filename in files:
+            paths.append(os.path.join(root, filename))
+    return paths
+
+
+def get_image_paths(list_source, recursive=False):
     """
-    Searches in the folder path given for the images present
+    Searches in the folder path given for image files without decoding them. Only files that \
+    OpenCV can read (checked through the file header) are included.
 
     :param list_source: Path to a folder of images
     :type list_source: :class:`str`
     :param recursive: Flag to allow search in the all directories of the folder
     :type recursive: :class:`bool`
+    :return: list of paths
+    :rtype: :class:`list`
+    """
+    return [
+        path
+        for path in _folder_files(list_source, recursive=recursive)
+        if cv2.haveImageReader(path)
+    ]
+
+
+def open_folder(list_source, recursive=False, workers=None, strict=False):
+    """
+    Searches in the folder path given for the images present and decodes them using a pool of \
+    threads (decoding releases the GIL). The order of the images is the same as the order of the \
+    files. Files that aren't images are ignored, images that can't be decoded (e.g. corrupted \
+    files) are reported with a warning, or an error if `strict` is `True`.
+
+    :param list_source: Path to a folder of images
+    :type list_source: :class:`str`
+    :param recursive: Flag to allow search in the all directories of the folder
+    :type recursive: :class:`bool`
+    :param workers: Number of threads used to decode the images, defaults to the number of \
+    threads chosen by :class:`~concurrent.futures.ThreadPoolExecutor`
+    :type workers: :class:`int`, optional
+    :param strict: `True` to raise an error if an image can't be decoded, defaults to `False`
+    :type strict: :class:`bool`, optional
     :return: list of images
     :rtype: :class:`list`
     """
-    if not recursive:
-        paths = [os.path.join(list_source, fn) for fn in next(os.walk(list_source))[2]]
+    paths = get_image_paths(list_source, recursive=recursive)
+    if workers == 1:
+        decoded = [cv2.imread(path) for path in paths]
     else:
-        paths = []
-        for root, _, files in os.walk(list_source):
-            for filename in files:
-                paths.append(os.path.join(root, filename))
-    images = []
-    for file in paths:
-        tmp = get_image_array(file)
-        if tmp is not None:
-            images.append(tmp)
-    return images
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            decoded = list(executor.map(cv2.imread, paths))
+
+    failed = [path for path, image in zip(paths, decoded) if image is None]
+    if failed:
+        message = "Failed to decode {} image(s): {}".format(
+            len(failed), ", ".join(failed)
+        )
+        if strict:
+            raise ImageDecodeError(message)
+        warnings.warn(message)
+
+    return [image for image in decoded if image is not None]
 
 
-def get_image_list(list_source, recursive=False):
+def get_image_list(list_source, recursive=False, workers=None, strict=False):
     """
     Gets all the images from a folder
 
@@ -134,10 +259,17 @@ def get_image_list(list_source, recursive=False):
     :type list_source: :class:`str`
     :param recursive: Flag to allow search in the all directories of the folder
     :type recursive: :class:`bool`
+    :param workers: Number of threads used to decode the images, defaults to the number of \
+    threads chosen by :class:`~concurrent.futures.ThreadPoolExecutor`
+    :type workers: :class:`int`, optional
+    :param strict: `True` to raise an error if an image can't be decoded, defaults to `False`
+    :type strict: :class:`bool`, optional
     :return: list of images
     :rtype: :class:`list`
     """
     if isinstance(list_source, str):
-        return open_folder(list_source, recursive=recursive)
+        return open_folder(
+            list_source, recursive=recursive, workers=workers, strict=strict
+        )
     else:
         return np.copy(list_source)
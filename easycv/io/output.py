@@ -1,11 +1,16 @@
-import cv2
-from PIL import Image
-from matplotlib import pyplot as plt
-import matplotlib as mpl
+import os
 import sys
 
+import cv2
+
 from easycv.utils import nearest_square_side
 
+QUALITY_FLAGS = {
+    "jpg": cv2.IMWRITE_JPEG_QUALITY,
+    "jpeg": cv2.IMWRITE_JPEG_QUALITY,
+    "webp": cv2.IMWRITE_WEBP_QUALITY,
+}
+
 
 def prepare_image_to_output(img_arr, rgb=True):
     """
@@ -36,11 +41,64 @@ def save(img_arr, filename, format=None):
     :param format: File Format, defaults to None
     :type format: :class:`str`, optional
     """
+    from PIL import Image
+
     img_arr = prepare_image_to_output(img_arr)
     im = Image.fromarray(img_arr)
     im.save(filename, format)
 
 
+def encode(img_arr, format="png", quality=None, compression=None):
+    """
+    Encodes an image into a file format with OpenCV (the array is used as is, without color \
+    conversions or copies).
+
+    :param img_arr: Image as an array
+    :type img_arr: :class:`~numpy:numpy.ndarray`
+    :param format: File format (e.g. png, jpg, webp, bmp, tiff), defaults to png
+    :type format: :class:`str`, optional
+    :param quality: Quality of jpeg/webp images (0-100), defaults to the OpenCV default
+    :type quality: :class:`int`, optional
+    :param compression: Compression level of png images (0-9), defaults to the OpenCV default
+    :type compression: :class:`int`, optional
+    :return: Encoded image
+    :rtype: :class:`bytes`
+    """
+    format = format.lower().lstrip(".")
+    params = []
+    if quality is not None and format in QUALITY_FLAGS:
+        params += [QUALITY_FLAGS[format], quality]
+    if compression is not None and format == "png":
+        params += [cv2.IMWRITE_PNG_COMPRESSION, compression]
+
+    success, data = cv2.imencode("." + format, img_arr, params)
+    if not success:
+        raise ValueError("Failed to encode image as {}".format(format))
+    return data.tobytes()
+
+
+def write_image(img_arr, filename, format=None, quality=None, compression=None):
+    """
+    Encodes an image with OpenCV (see :func:`encode`) and writes it to a file.
+
+    :param img_arr: Image as an array
+    :type img_arr: :class:`~numpy:numpy.ndarray`
+    :param filename: Filename
+    :type filename: :class:`str`
+    :param format: File format, defaults to the extension of the filename
+    :type format: :class:`str`, optional
+    :param quality: Quality of jpeg/webp images (0-100), defaults to the OpenCV default
+    :type quality: :class:`int`, optional
+    :param compression: Compression level of png images (0-9), defaults to the OpenCV default
+    :type compression: :class:`int`, optional
+    """
+    if format is None:
+        format = os.path.splitext(filename)[1]
+    data = encode(img_arr, format, quality=quality, compression=compression)
+    with open(filename, "wb") as f:
+        f.write(data)
+
+
 def show(img_arr, name="Image", wait_time=500):
     """
     Creates a cv2 window and displays the given image arrays
@@ -76,6 +134,9 @@ def show_grid(images, titles=(), size=(10, 10), shape="auto"):
     :param shape: Shape of grid
     :type shape: :class:`tuple`, optional
     """
+    import matplotlib as mpl
+    from matplotlib import pyplot as plt
+
     if "ipykernel" in sys.modules:
         mpl.use("module://ipykernel.pylab.backend_inline")
     if shape == "auto":
@@ -1,34 +1,116 @@
+import asyncio
+import os
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
-
-import ray
+from itertools import islice
 
 import easycv.image
-from easycv.io import show_grid, get_image_list
-from easycv.collection import auto_compute
+from easycv.io import (
+    show_grid,
+    get_image_list,
+    get_image_paths,
+    open_images,
+    random_dog_images,
+    is_container,
+    read_container,
+    write_container,
+    write_image,
+)
+from easycv.collection import auto_compute, run_in_executor
+from easycv.executors import (
+    ImageFailure,
+    RayExecutor,
+    check_error_policy,
+    get_executor,
+    guard,
+    summarize_failures,
+    _apply_image,
+    _compute_image,
+)
 from easycv.transforms.base import Transform
+from easycv.validators import Number
 from easycv.errors.list import InvalidListInputSource
 
+_size_validator = Number(min_value=1, only_integer=True)
+
+
+def _stream_image(image):
+    if image._lazy:
+        return easycv.image.Image._wrap(image._computed_array())
+    return image
+
+
+def _merge_cached(cache, keys, cached, computed, images):
+    # computed holds the results of the entries that were not in the cache (in order), results
+    # that are images are stored as arrays
+    computed = iter(computed)
+    results = []
+    for key, value in zip(keys, cached):
+        if value is None:
+            result = next(computed)
+            if key is not None and not isinstance(result, ImageFailure):
+                cache.put(key, result.array if images else result)
+        else:
+            result = easycv.image.Image._wrap(value) if images else value
+        results.append(result)
+    return results
+
 
 class List:
     """
     This class represents a list of Images.
-    Lists can be created from a list of image objects or by asking for a random list of images.
+    Lists can be created from a list of image objects, a list of paths/links to images, a folder, \
+    a file created with :meth:`dump` or by asking for a random list of images. Images from links \
+    are downloaded concurrently. Images from a dumped file are memory mapped (only the parts \
+    of the file that are used are read).
     Images inside the List can be lazy (delayed computation) or normal (everything runs in \
     the moment). Lists support parallel processing, locally or in a distributed cluster.
 
     :param images: List of the images to include
     :type images: :class:`list`
+    :param workers: Number of threads used to decode/download the images of a folder or list of \
+    paths/links, defaults to the number of threads chosen by \
+    :class:`~concurrent.futures.ThreadPoolExecutor` (folders) or the maximum number of \
+    concurrent downloads (links)
+    :type workers: :class:`int`, optional
+    :param strict: `True` to raise an error if an image of a folder can't be decoded, `False` to \
+    skip it with a warning, defaults to `False`
+    :type strict: :class:`bool`, optional
     """
 
-    def __init__(self, source, recursive=False, lazy=False):
+    failures = ()  # Failures of the last operation (see the errors argument of apply)
+
+    def __init__(self, source, recursive=False, lazy=False, workers=None, strict=False):
         if isinstance(source, list) and all(
             isinstance(i, easycv.image.Image) for i in source
         ):
             self._images = source
+        elif isinstance(source, list) and all(isinstance(i, str) for i in source):
+            if lazy:
+                self._images = [easycv.image.Image(path, lazy=True) for path in source]
+            else:
+                self._images = [
+                    easycv.image.Image._wrap(img)
+                    for img in open_images(source, workers=workers)
+                ]
+        elif isinstance(source, str) and is_container(source):
+            self._images = [
+                easycv.image.Image._wrap(array) for array in read_container(source)
+            ]
+        elif isinstance(source, str) and lazy:
+            # lazy lists only keep the paths, images are decoded when needed
+            self._images = [
+                easycv.image.Image(path, lazy=True)
+                for path in get_image_paths(source, recursive=recursive)
+            ]
         elif isinstance(source, str):
             images = [
                 easycv.image.Image(img, lazy=lazy)
-                for img in get_image_list(source, recursive=recursive)
+                for img in get_image_list(
+                    source, recursive=recursive, workers=workers, strict=strict
+                )
             ]
             self._images = images
         else:
@@ -50,14 +132,15 @@ class List:
         """
         Starts the local cluster for parallel processing if it isn't already running.
         """
-        if not ray.is_initialized():
-            ray.init(logging_level=40)
+        RayExecutor.start()
 
     @staticmethod
     def shutdown():
         """
         Shutdowns the local cluster for parallel processing if it is running.
         """
+        import ray
+
         if ray.is_initialized():
             ray.shutdown()
 
@@ -74,21 +157,60 @@ class List:
         :return: Random list of Images
         :rtype: :class:`~easycv.list.List`
         """
-        images = [easycv.image.Image.random(lazy=lazy) for _ in range(length)]
-        return cls(images)
+        return cls(random_dog_images(length), lazy=lazy)
 
     @staticmethod
-    @ray.remote
-    def _process_image(operation, image):
-        image.load()
-        return operation.apply(image)
+    def _apply_batched(images, operation, batch_size, errors="raise", retries=0):
+        operation_outputs = []
+        for start in range(0, len(images), batch_size):
+            batch = images[start : start + batch_size]
+            try:
+                outputs = operation.batch([i.array for i in batch])
+            except Exception:
+                if errors == "raise":
+                    raise
+                # the images of the batch are processed one at a time to isolate the failure
+                apply = guard(operation.apply, errors, retries)
+                operation_outputs.extend(apply(i) for i in batch)
+                continue
+
+            if operation.outputs == {}:
+                outputs = [easycv.image.Image(output["image"]) for output in outputs]
+            operation_outputs.extend(outputs)
+        return operation_outputs
+
+    def _handle_failures(self, results, errors, images=True):
+        failures = []
+        for index, result in enumerate(results):
+            if isinstance(result, ImageFailure):
+                result.index = index
+                failures.append(result)
+
+        self.failures = failures
+        if failures:
+            warnings.warn(summarize_failures(failures, len(results)))
+            # lists only hold images, failed images are left out and only described in failures
+            if errors == "skip" or images:
+                results = [r for r in results if not isinstance(r, ImageFailure)]
+        return results, failures
 
     @staticmethod
-    @ray.remote
-    def _compute_image(image):
-        return image.compute(image, in_place=False)
+    def _from_results(results, failures):
+        new_list = List(results)
+        new_list.failures = failures
+        return new_list
 
-    def apply(self, operation, in_place=False, parallel=False):
+    def apply(
+        self,
+        operation,
+        in_place=False,
+        parallel=False,
+        batch_size=None,
+        cache=None,
+        chunk_size=None,
+        errors="raise",
+        retries=0,
+    ):
         """
         Returns a new **image** with the :doc:`transform <transforms/index>` or \
         :doc:`pipeline <pipeline>` applied.
@@ -102,36 +224,94 @@ class List:
         :param in_place: `True` to change the current **list**, `False` to return a new one with \
         the transform applied, defaults to `False`
         :type in_place: :class:`bool`, optional
-        :param parallel: `True` to apply the transform in parallel `False` otherwise, defaults to \
-        `False`
-        :type parallel: :class:`bool`, optional
+        :param parallel: Executor used to apply the transform in parallel: "threads", \
+        "processes", "ray" (`True` also selects ray) or an \
+        :class:`~easycv.executors.Executor`, `False` to apply it in the current thread, \
+        defaults to `False`. Results are in the same order with any executor
+        :type parallel: :class:`bool`/:class:`str`/:class:`~easycv.executors.Executor`, optional
+        :param batch_size: Number of images processed together by transforms that support \
+        batches (e.g. :class:`~easycv.transforms.detect.Detect`), defaults to the transform \
+        batch size. Only used when not running in parallel and none of the images is lazy
+        :type batch_size: :class:`int`, optional
+        :param cache: Cache of results, images whose result is in the cache are not processed \
+        and the new results are stored. When a cache is used lazy images are computed \
+        immediately, defaults to None
+        :type cache: :class:`~easycv.cache.ResultCache`, optional
+        :param chunk_size: Number of images processed by each parallel task, defaults to a size \
+        chosen from the measured cost of the first image
+        :type chunk_size: :class:`int`, optional
+        :param errors: What to do when an image fails: "raise" the error, "skip" the image or \
+        "record" the failure. With "skip" and "record" failed images are left out of the \
+        resulting **list**, a summary is shown as a warning and an \
+        :class:`~easycv.executors.ImageFailure` for each of them (with its index in this \
+        **list**) is kept in the `failures` attribute. When the operation returns other \
+        outputs, "record" keeps the failures in place of the outputs, defaults to "raise"
+        :type errors: :class:`str`, optional
+        :param retries: Number of times an image is retried after failing (e.g. downloads), \
+        defaults to 0
+        :type retries: :class:`int`, optional
         :return: The new **list** if `in_place` is *False*
         :rtype: :class:`~eascv.list.List`
         """
-        if parallel:
-            self.start()
-
+        check_error_policy(errors)
+        for name, size in (("batch_size", batch_size), ("chunk_size", chunk_size)):
+            if size is not None:
+                _size_validator.check(name, size)
         if isinstance(operation, Transform):
             operation.initialize()
+        if not isinstance(operation, Transform) or operation.batch_size is None:
+            batch_size = None
+        elif batch_size is None:
+            batch_size = operation.batch_size
         outputs = operation.outputs
 
+        images = self._images
+        if cache is not None:
+            keys = [cache.key(i, operation) for i in self._images]
+            cached = [cache.get(key) for key in keys]
+            images = [i for i, value in zip(self._images, cached) if value is None]
+
         if parallel:
-            operation = ray.put(operation)
-            operation_outputs = ray.get(
-                [self._process_image.remote(operation, i) for i in self._images]
+            operation_outputs = get_executor(parallel).apply(
+                operation,
+                images,
+                chunk_size=chunk_size,
+                errors=errors,
+                retries=retries,
+            )
+        elif batch_size is not None and not any(i._lazy for i in images):
+            operation_outputs = self._apply_batched(
+                images, operation, batch_size, errors=errors, retries=retries
             )
         else:
-            operation_outputs = [operation.apply(i) for i in self._images]
+            apply = guard(operation.apply, errors, retries)
+            operation_outputs = [apply(i) for i in images]
+
+        if cache is not None:
+            operation_outputs = _merge_cached(
+                cache, keys, cached, operation_outputs, outputs == {}
+            )
+        operation_outputs, failures = self._handle_failures(
+            operation_outputs, errors, images=outputs == {}
+        )
 
         if outputs == {}:
             if in_place:
                 self._images = operation_outputs
             else:
-                return List(operation_outputs)
+                return self._from_results(operation_outputs, failures)
         else:
             return operation_outputs
 
-    def compute(self, in_place=True, parallel=False):
+    def compute(
+        self,
+        in_place=True,
+        parallel=False,
+        cache=None,
+        chunk_size=None,
+        errors="raise",
+        retries=0,
+    ):
         """
         Returns a new **list** with all the pending operations applied.
         If `in_place` is *True* the pending operations will be applied
@@ -140,23 +320,292 @@ class List:
         :param in_place: `True` to change the current **list**, `False` to return a new one with \
          the pending transforms applied, defaults to `list`
         :type in_place: :class:`bool`, optional
-        :param parallel: `True` to compute in parallel `False` otherwise, defaults to `False`
-        :type parallel: :class:`bool`, optional
+        :param parallel: Executor used to compute in parallel (see :meth:`apply`), `False` \
+        to compute in the current thread, defaults to `False`
+        :type parallel: :class:`bool`/:class:`str`/:class:`~easycv.executors.Executor`, optional
+        :param cache: Cache of results, images whose result is in the cache are not computed \
+        and the new results are stored, defaults to None
+        :type cache: :class:`~easycv.cache.ResultCache`, optional
+        :param chunk_size: Number of images computed by each parallel task, defaults to a size \
+        chosen from the measured cost of the first image
+        :type chunk_size: :class:`int`, optional
+        :param errors: What to do when an image fails (see :meth:`apply`), defaults to "raise"
+        :type errors: :class:`str`, optional
+        :param retries: Number of times an image is retried after failing, defaults to 0
+        :type retries: :class:`int`, optional
         :return: The new **list** if `in_place` is *False*
         :rtype: :class:`~eascv.list.List`
         """
-        if parallel:
-            self.start()
+        check_error_policy(errors)
+        if chunk_size is not None:
+            _size_validator.check("chunk_size", chunk_size)
+        images = self._images
+        if cache is not None:
+            # only images with pending operations are worth caching
+            keys = [
+                cache.key(i) if i._lazy and i.pending.num_transforms() else None
+                for i in self._images
+            ]
+            cached = [cache.get(key) if key else None for key in keys]
+            images = [i for i, value in zip(self._images, cached) if value is None]
 
         if parallel:
-            images = ray.get([self._compute_image.remote(i) for i in self._images])
+            images = get_executor(parallel).compute(
+                images, chunk_size=chunk_size, errors=errors, retries=retries
+            )
         else:
-            images = [i.compute(in_place=False) for i in self._images]
+            compute = guard(_compute_image, errors, retries)
+            images = [compute(i) for i in images]
+
+        if cache is not None:
+            images = _merge_cached(cache, keys, cached, images, True)
+        images, failures = self._handle_failures(images, errors)
 
         if in_place:
             self._images = images
         else:
-            return List(images)
+            return self._from_results(images, failures)
+
+    def imap(
+        self,
+        operation,
+        parallel=True,
+        in_flight=None,
+        ordered=False,
+        errors="raise",
+        retries=0,
+    ):
+        """
+        Applies the :doc:`transform <transforms/index>` or :doc:`pipeline <pipeline>` to every \
+        image and yields `(index, output)` pairs as soon as each image is processed, so \
+        outputs can be used (e.g. saved) while the rest are processed. Lazy images are computed.
+
+        :param operation: Operation to be applied
+        :type operation: :class:`~easycv.transforms.operation.Operation`
+        :param parallel: Executor used to process the images (see :meth:`apply`), `False` to \
+        process them one at a time in the current thread, defaults to `True` (ray)
+        :type parallel: :class:`bool`/:class:`str`/:class:`~easycv.executors.Executor`, optional
+        :param in_flight: Maximum number of images being processed (or waiting to be yielded) \
+        at the same time, defaults to twice the number of workers
+        :type in_flight: :class:`int`, optional
+        :param ordered: `True` to yield the outputs in the same order as the images, `False` \
+        to yield them as they finish, defaults to `False`
+        :type ordered: :class:`bool`, optional
+        :param errors: What to do when an image fails (see :meth:`apply`), with "record" the \
+        failures are yielded in place of the outputs. The summary is shown and `failures` is \
+        updated when the generator finishes, defaults to "raise"
+        :type errors: :class:`str`, optional
+        :param retries: Number of times an image is retried after failing, defaults to 0
+        :type retries: :class:`int`, optional
+        :return: Generator of `(index, output)` pairs
+        :rtype: :class:`generator`
+        """
+        check_error_policy(errors)
+        if isinstance(operation, Transform):
+            operation.initialize()
+        executor = get_executor(parallel or "serial")
+        return self._imap(
+            executor.imap(
+                operation,
+                self._images,
+                in_flight=in_flight,
+                ordered=ordered,
+                errors=errors,
+                retries=retries,
+            ),
+            errors,
+        )
+
+    def _imap(self, outputs, errors):
+        failures = []
+        for index, output in outputs:
+            if isinstance(output, ImageFailure):
+                output.index = index
+                failures.append(output)
+                if errors == "skip":
+                    continue
+            yield index, output
+
+        self.failures = failures
+        if failures:
+            warnings.warn(summarize_failures(failures, len(self._images)))
+
+    async def apply_async(self, operation, in_place=False, limit=8, executor=None):
+        """
+        Asynchronous version of :meth:`apply`. Images are loaded (downloaded/decoded) and \
+        transformed in an executor so the event loop isn't blocked, up to `limit` images at the \
+        same time. The resulting images are computed, images of this **list** are left as they \
+        are (lazy images stay unloaded).
+
+        :param operation: Operation to be applied
+        :type operation: :class:`~easycv.transforms.operation.Operation`
+        :param in_place: `True` to change the current **list**, `False` to return a new one with \
+        the transform applied, defaults to `False`
+        :type in_place: :class:`bool`, optional
+        :param limit: Maximum number of images processed at the same time, defaults to 8
+        :type limit: :class:`int`, optional
+        :param executor: Executor to use, defaults to the event loop default executor
+        :type executor: :class:`~concurrent.futures.Executor`, optional
+        :return: The new **list** if `in_place` is *False*
+        :rtype: :class:`~eascv.list.List`
+        """
+        if isinstance(operation, Transform):
+            operation.initialize()
+        outputs = operation.outputs
+
+        semaphore = asyncio.Semaphore(limit)
+        operation_outputs = await asyncio.gather(
+            *(
+                run_in_executor(
+                    _apply_image,
+                    operation,
+                    image,
+                    executor=executor,
+                    semaphore=semaphore,
+                )
+                for image in self._images
+            )
+        )
+
+        if outputs == {}:
+            if in_place:
+                self._images = list(operation_outputs)
+            else:
+                return List(list(operation_outputs))
+        else:
+            return list(operation_outputs)
+
+    async def compute_async(self, in_place=True, limit=8, executor=None):
+        """
+        Asynchronous version of :meth:`compute`. Images are loaded (downloaded/decoded) and \
+        computed in an executor so the event loop isn't blocked, up to `limit` images at the \
+        same time.
+
+        :param in_place: `True` to change the current **list**, `False` to return a new one with \
+         the pending transforms applied, defaults to `True`
+        :type in_place: :class:`bool`, optional
+        :param limit: Maximum number of images computed at the same time, defaults to 8
+        :type limit: :class:`int`, optional
+        :param executor: Executor to use, defaults to the event loop default executor
+        :type executor: :class:`~concurrent.futures.Executor`, optional
+        :return: The new **list** if `in_place` is *False*
+        :rtype: :class:`~eascv.list.List`
+        """
+        semaphore = asyncio.Semaphore(limit)
+        images = await asyncio.gather(
+            *(
+                run_in_executor(
+                    _compute_image, image, executor=executor, semaphore=semaphore
+                )
+                for image in self._images
+            )
+        )
+
+        if in_place:
+            self._images = list(images)
+        else:
+            return List(list(images))
+
+    def stream(self, prefetch=4):
+        """
+        Iterates over the **list** yielding each image with its pending operations applied. \
+        Lazy images are decoded and computed in background threads, up to `prefetch` images \
+        ahead of the one being used, and are not kept in the **list** after being yielded. This \
+        allows processing folders larger than the available memory (see `lazy` when creating \
+        a **list** from a folder).
+
+        :param prefetch: Number of images prepared in advance, defaults to 4
+        :type prefetch: :class:`int`, optional
+        :return: Generator of computed images
+        :rtype: :class:`generator`
+        """
+        if prefetch < 1:
+            for image in self._images:
+                yield _stream_image(image)
+            return
+
+        images = iter(self._images)
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            queue = deque(
+                executor.submit(_stream_image, image)
+                for image in islice(images, prefetch)
+            )
+            while queue:
+                image = queue.popleft().result()
+                for next_image in islice(images, 1):
+                    queue.append(executor.submit(_stream_image, next_image))
+                yield image
+
+    def dump(self, filename):
+        """
+        Saves the **list** to a single file that can be reopened without decoding the images \
+        (`List(filename)`). Pending operations are applied before saving (lazy images are \
+        computed one at a time and not kept in memory).
+
+        :param filename: Name of the file
+        :type filename: :class:`str`
+        """
+        write_container(filename, (image.array for image in self.stream()))
+
+    def save(
+        self,
+        folder,
+        pattern="{index}",
+        format="png",
+        quality=None,
+        compression=None,
+        workers=None,
+    ):
+        """
+        Saves every image of the **list** to a folder. Images are encoded with OpenCV and \
+        written by a pool of threads. Pending operations are applied before saving (lazy images \
+        are computed in the background, see :meth:`stream`).
+
+        :param folder: Folder where the images are saved (created if it doesn't exist)
+        :type folder: :class:`str`
+        :param pattern: Pattern of the filenames (without extension), `{index}` is replaced by \
+        the position of the image, defaults to "{index}"
+        :type pattern: :class:`str`, optional
+        :param format: File format (e.g. png, jpg, webp), defaults to png
+        :type format: :class:`str`, optional
+        :param quality: Quality of jpeg/webp images (0-100), defaults to the OpenCV default
+        :type quality: :class:`int`, optional
+        :param compression: Compression level of png images (0-9), defaults to the OpenCV \
+        default
+        :type compression: :class:`int`, optional
+        :param workers: Number of threads writing images, defaults to the number of cpus
+        :type workers: :class:`int`, optional
+        :return: Paths of the saved images
+        :rtype: :class:`list`
+        """
+        os.makedirs(folder, exist_ok=True)
+        workers = workers or os.cpu_count() or 1
+        format = format.lower().lstrip(".")
+        filenames = [
+            os.path.join(folder, pattern.format(index=i) + "." + format)
+            for i in range(len(self._images))
+        ]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # limit the number of computed images waiting to be written
+            queue = deque()
+            for filename, image in zip(filenames, self.stream()):
+                if len(queue) >= 2 * workers:
+                    queue.popleft().result()
+                queue.append(
+                    executor.submit(
+                        write_image,
+                        image.array,
+                        filename,
+                        format,
+                        quality=quality,
+                        compression=compression,
+                    )
+                )
+            for future in queue:
+                future.result()
+
+        return filenames
 
     def copy(self):
         """
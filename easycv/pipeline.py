@@ -2,12 +2,23 @@ import os
 import pickle
 from copy import deepcopy
 
+import cv2
+import numpy as np
+
 from easycv.transforms.base import Transform
 from easycv.errors import InvalidPipelineInputSource
 
 
-class Pipeline:
+def _pooled(buffers):
+    # arrays kept for reuse by a pipeline and its nested pipelines
+    for buffer in buffers.values():
+        if isinstance(buffer, dict):
+            yield from _pooled(buffer)
+        else:
+            yield buffer
 
+
+class Pipeline:
     """
     This class represents a **pipeline**.
 
@@ -25,6 +36,7 @@ class Pipeline:
     """
 
     def __init__(self, source, name=None):
+        self._tables = {}
         if isinstance(source, list):
             self.forwards = Pipeline._calculate_forwards(source)
 
@@ -78,27 +90,148 @@ class Pipeline:
 
         return forwards
 
-    def __call__(self, image):
+    def __call__(self, image, buffers=None, reuse_output=False):
         if self._transforms:
             outputs = {}
-            for i in range(len(self._transforms)):
-                transform = self._transforms[i]
-                forwarded = {
-                    arg: outputs[self.forwards[i][arg]][arg] for arg in self.forwards[i]
-                }
-                if isinstance(transform, Transform):
-                    output = transform(image, forwarded=forwarded)
+            i = 0
+            while i < len(self._transforms):
+                end = self._pointwise_end(i, image)
+                if end - i > 1:
+                    step = end - 1
+                    dst = self._buffer(buffers, step, image, reuse_output)
+                    output = {
+                        "image": cv2.LUT(
+                            image, self._lookup_table(self._transforms[i:end]), dst=dst
+                        )
+                    }
+                    self._keep(buffers, step, output, image, reuse_output)
                 else:
-                    output = transform(image)
+                    step = i
+                    transform = self._transforms[i]
+                    forwarded = {
+                        arg: outputs[self.forwards[i][arg]][arg]
+                        for arg in self.forwards[i]
+                    }
+                    if isinstance(transform, Transform):
+                        dst = self._buffer(buffers, step, image, reuse_output)
+                        output = transform(image, forwarded=forwarded, dst=dst)
+                        self._keep(buffers, step, output, image, reuse_output)
+                    elif buffers is not None:
+                        output = transform(
+                            image,
+                            buffers=buffers.setdefault(step, {}),
+                            reuse_output=self._reuses(buffers, step, reuse_output),
+                        )
+                    else:
+                        output = transform(image)
 
                 if "image" in output:
                     image = output["image"]
 
-                outputs[i] = output
+                outputs[step] = output
+                i = step + 1
 
             return outputs[len(self._transforms) - 1]
         return {"image": image}
 
+    def stream(self, images, reuse_output=False):
+        """
+        Applies the **pipeline** to a sequence of images, yielding the outputs one by one. \
+        Intermediate results are written into arrays allocated for the previous images (when \
+        shapes and types match), so long sequences (like video frames or large folders) don't \
+        allocate new intermediate arrays for every image.
+
+        :param images: Iterable of images (arrays)
+        :type images: :class:`iterable`
+        :param reuse_output: If True the final output also reuses the same array, so each output \
+        is only valid until the next one is requested, defaults to False
+        :type reuse_output: :class:`bool`, optional
+        :return: Generator of outputs
+        :rtype: :class:`generator`
+        """
+        buffers = {}
+        for image in images:
+            output = self(image, buffers=buffers, reuse_output=reuse_output)
+            array = output.get("image")
+            if not reuse_output and any(
+                np.may_share_memory(array, buffer) for buffer in _pooled(buffers)
+            ):
+                # the last step returned an intermediate array (or a view of it), which the
+                # next image would overwrite
+                output = dict(output, image=array.copy())
+            yield output
+
+    def _reuses(self, buffers, step, reuse_output):
+        return buffers is not None and (
+            step < len(self._transforms) - 1 or reuse_output
+        )
+
+    def _buffer(self, buffers, step, image, reuse_output):
+        if self._reuses(buffers, step, reuse_output):
+            dst = buffers.get(step)
+            if dst is not image:
+                return dst
+        return None
+
+    def _keep(self, buffers, step, output, image, reuse_output):
+        if self._reuses(buffers, step, reuse_output):
+            array = output.get("image")
+            # only arrays owned by this step can be safely overwritten later
+            if (
+                isinstance(array, np.ndarray)
+                and array is not image
+                and array.flags.owndata
+            ):
+                buffers[step] = array
+            else:
+                buffers.pop(step, None)
+
+    def _pointwise_end(self, start, image):
+        end = start
+        if isinstance(image, np.ndarray) and image.dtype == np.uint8:
+            while (
+                end < len(self._transforms)
+                and isinstance(self._transforms[end], Transform)
+                and self._transforms[end].pointwise
+                and not self.forwards[end]
+            ):
+                end += 1
+        return end
+
+    def _lookup_table(self, transforms):
+        """
+        Returns the composition of the lookup tables of a chain of pointwise transforms. \
+        Composed tables are cached by the transforms and their arguments, so they are only \
+        built once for every fused range of the **pipeline**.
+        """
+        key = pickle.dumps([(type(t), t._args) for t in transforms])
+        if key not in self._tables:
+            table = np.arange(256, dtype="uint8")
+            for transform in transforms:
+                table = transform.lookup_table()[table]
+            self._tables[key] = table
+        return self._tables[key]
+
+    @property
+    def modifies_input(self):
+        """
+        Returns True if any transform of the **pipeline** may write into the given image.
+
+        :return: True if the pipeline modifies its input
+        :rtype: :class:`bool`
+        """
+        return any(t.modifies_input for t in self._transforms)
+
+    @property
+    def preserves_shape(self):
+        """
+        Returns True if the outputs of the **pipeline** always have the same shape as its input.
+
+        :return: True if the pipeline preserves the shape of images
+        :rtype: :class:`bool`
+        """
+        return all(t.preserves_shape for t in self._transforms)
+
     @property
     def name(self):
         """
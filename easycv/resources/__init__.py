@@ -6,6 +6,15 @@ from easycv.resources.resources import (
     get_resources_folder,
 )
 from easycv.resources.creator import create_resource
+from easycv.resources.networks import (
+    register_network,
+    registered_networks,
+    loaded_networks,
+    use_network,
+    preload_networks,
+    clear_networks,
+    set_networks_memory_limit,
+)
 
 
 __all__ = [
@@ -15,4 +24,11 @@ __all__ = [
     "available_resources",
     "downloaded_resources",
     "get_resources_folder",
+    "register_network",
+    "registered_networks",
+    "loaded_networks",
+    "use_network",
+    "preload_networks",
+    "clear_networks",
+    "set_networks_memory_limit",
 ]
@@ -0,0 +1,165 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from easycv.resources.resources import get_resource
+from easycv.errors import InvalidNetwork
+
+_registry = {}
+_networks = OrderedDict()
+_lock = threading.RLock()
+_loading = {}  # One lock for each network being loaded
+_memory_limit = 2 ** 30
+
+
+class _CachedNetwork:
+    def __init__(self, network, size):
+        self.network = network
+        self.size = size
+        self.lock = threading.Lock()
+
+
+def register_network(name, resource_name, filenames, loader):
+    """
+    Registers a network so it can be loaded through the network cache. The network is built by \
+    calling `loader` with the paths of the given resource files (in order). Transforms that use \
+    neural networks should register them once at import time and access them through \
+    :func:`use_network`.
+
+    :param name: Name of the network
+    :type name: :class:`str`
+    :param resource_name: Name of the resource containing the network files
+    :type resource_name: :class:`str`
+    :param filenames: Files (inside the resource) needed to build the network
+    :type filenames: :class:`list`/:class:`tuple`
+    :param loader: Function that receives the paths of the files and returns the network
+    :type loader: :class:`function`
+    """
+    with _lock:
+        _registry[name] = {
+            "resource": resource_name,
+            "files": tuple(filenames),
+            "loader": loader,
+        }
+        _networks.pop(name, None)
+
+
+def registered_networks():
+    """
+    Obtains a list with the names of all registered networks.
+
+    :return: List containing the names of all registered networks
+    :rtype: :class:`list`
+    """
+    return list(_registry)
+
+
+def loaded_networks():
+    """
+    Obtains a list with the names of all networks currently in the cache, from the least to the \
+    most recently used.
+
+    :return: List containing the names of all loaded networks
+    :rtype: :class:`list`
+    """
+    with _lock:
+        return list(_networks)
+
+
+def _load(name):
+    if name not in _registry:
+        raise InvalidNetwork(name)
+
+    info = _registry[name]
+    paths = [str(get_resource(info["resource"], f)) for f in info["files"]]
+    size = sum(os.path.getsize(path) for path in paths)
+    return _CachedNetwork(info["loader"](*paths), size)
+
+
+def _evict(size):
+    used = sum(entry.size for entry in _networks.values())
+    while _networks and used + size > _memory_limit:
+        _, evicted = _networks.popitem(last=False)
+        used -= evicted.size
+
+
+def _cached(name):
+    with _lock:
+        if name in _networks:
+            _networks.move_to_end(name)
+            return _networks[name]
+        return None
+
+
+def _get(name):
+    entry = _cached(name)
+    if entry is not None:
+        return entry
+
+    with _lock:
+        loading = _loading.setdefault(name, threading.Lock())
+    # networks are downloaded/built without holding the cache lock, so threads using other
+    # networks aren't blocked. Threads requesting the same network wait for a single load
+    with loading:
+        entry = _cached(name)
+        if entry is not None:
+            return entry
+
+        entry = _load(name)
+        with _lock:
+            _evict(entry.size)
+            _networks[name] = entry
+            _loading.pop(name, None)
+        return entry
+
+
+@contextmanager
+def use_network(name):
+    """
+    Context manager that gives access to a registered network. The network is only built the \
+    first time it is requested, after that it stays cached in memory until it is evicted (least \
+    recently used networks are evicted first when the memory limit is reached). While inside \
+    the context no other thread can use the same network.
+
+    :param name: Name of the network
+    :type name: :class:`str`
+    """
+    entry = _get(name)
+    with entry.lock:
+        yield entry.network
+
+
+def preload_networks(*names):
+    """
+    Loads the given networks into the cache. Useful to warm up worker processes before they \
+    start processing images.
+
+    :param names: Names of the networks to load
+    :type names: :class:`str`
+    """
+    for name in names:
+        _get(name)
+
+
+def clear_networks():
+    """
+    Removes all networks from the cache.
+    """
+    with _lock:
+        _networks.clear()
+
+
+def set_networks_memory_limit(limit):
+    """
+    Sets the maximum memory (in bytes) used by cached networks. The memory used by a network is \
+    estimated from the size of its files. If a single network exceeds the limit it is still \
+    loaded but every other network is evicted.
+
+    :param limit: Memory limit in bytes, defaults to 1GB
+    :type limit: :class:`int`
+    """
+    global _memory_limit
+    with _lock:
+        _memory_limit = limit
+        _evict(0)
@@ -0,0 +1,60 @@
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+
+_lock = threading.Lock()
+_folder = None
+_owner = None  # pid of the process that created the folder (None if set by the user)
+
+
+def _default_root():
+    # scratch files can be as large as whole videos, so a RAM-backed folder (like /dev/shm) is
+    # only used if it is chosen through the environment variable
+    return os.environ.get("EASYCV_SCRATCH_DIR") or tempfile.gettempdir()
+
+
+def _remove(folder, owner):
+    # forked processes inherit the exit handlers, only the creator removes the folder
+    if owner == os.getpid():
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def get_scratch_folder():
+    """
+    Returns the folder used to store temporary files (like the chunks of a video being \
+    processed). By default each process creates its own folder inside `EASYCV_SCRATCH_DIR` (if \
+    the environment variable is set) or the system temporary directory. Setting \
+    `EASYCV_SCRATCH_DIR` to a RAM-backed folder (like /dev/shm) speeds up video processing if it \
+    has room for the videos being processed. The folder is created the first time it is needed \
+    and removed when the process exits, so concurrent jobs never touch each other's files.
+
+    :return: Path to the scratch folder
+    :rtype: :class:`str`
+    """
+    global _folder, _owner
+    with _lock:
+        if _folder is None or (_owner is not None and _owner != os.getpid()):
+            root = _default_root()
+            os.makedirs(root, exist_ok=True)
+            _folder = tempfile.mkdtemp(prefix="easycv-", dir=root)
+            _owner = os.getpid()
+            atexit.register(_remove, _folder, _owner)
+        return _folder
+
+
+def set_scratch_folder(folder):
+    """
+    Sets the folder used to store temporary files, for example to share it between the processes \
+    of a job. The folder is created if it doesn't exist and it is not removed when the process \
+    exits (only the temporary files are).
+
+    :param folder: Path to the scratch folder
+    :type folder: :class:`str`
+    """
+    global _folder, _owner
+    with _lock:
+        os.makedirs(folder, exist_ok=True)
+        _folder = str(folder)
+        _owner = None
@@ -1,6 +1,5 @@
 import sys
-from functools import wraps
-from types import FunctionType
+from inspect import Parameter, Signature
 
 from easycv.transforms.noise import Noise
 from easycv.transforms.filter import Blur, Sharpness, Sharpen
@@ -33,7 +32,16 @@ from easycv.transforms.spatial import (
     Paste,
 )
 from easycv.transforms.selectors import Select, Mask, Inpaint
-from easycv.transforms.detect import Scan, Eyes, Faces, Smile, Lines, Circles, Detect
+from easycv.transforms.detect import (
+    Scan,
+    Eyes,
+    Faces,
+    FaceFeatures,
+    Smile,
+    Lines,
+    Circles,
+    Detect,
+)
 from easycv.transforms.draw import Draw
 from easycv.transforms.morphological import Erode, Dilate, Morphology
 
@@ -50,6 +58,7 @@ transforms = [
     Crop,
     Eyes,
     Faces,
+    FaceFeatures,
     Draw,
     Detect,
     Dilate,
@@ -87,51 +96,46 @@ transforms = [
 __all__ = [transform.__name__ for transform in transforms]
 
 
-def show_args(function, exclude_method=False):
-    @wraps(function)
-    def inner(transform, **kwargs):
-        if exclude_method and kwargs.get("method") is not None:
-            kwargs.pop("method")
-        return function(transform, arguments=kwargs)
+def set_signature(function, first_arg, defaults):
+    """
+    Sets the signature shown by help()/inspect for a function that receives the arguments of a \
+    transform (with their default values) as keyword arguments.
+    """
+    parameters = [Parameter(first_arg, Parameter.POSITIONAL_OR_KEYWORD)]
+    parameters.extend(
+        Parameter(arg, Parameter.POSITIONAL_OR_KEYWORD, default=default)
+        for arg, default in defaults.items()
+    )
+    parameters.append(Parameter("kwargs", Parameter.VAR_KEYWORD))
+    function.__signature__ = Signature(parameters)
+    return function
 
-    return inner
 
+def create_init(defaults):
+    def __init__(self, **kwargs):
+        super(self.__class__, self).__init__(**kwargs)
 
-def create_function(name, first_arg, args, defaults, function_code):
-    formatted_args = ", ".join("{}".format(arg) for arg in args)
-    formatted_args = (
-        formatted_args + ", **kwargs" if args else formatted_args + " **kwargs"
-    )
-    function_code = "def {}({}, {}): {}".format(
-        name, first_arg, formatted_args, function_code
-    )
-    compiled_func = compile(function_code, name, "exec")
-    function = FunctionType(compiled_func.co_consts[0], globals(), name)
-    function.__defaults__ = tuple(defaults)
-    return function
+    return set_signature(__init__, "self", defaults)
 
 
 def add_method_function(transform, method_name, defaults):
-    method_code = 'return cls(method="{}", **kwargs["arguments"])'.format(method_name)
-    method_function = create_function(
-        method_name, "cls", default_values, tuple(defaults.values()), method_code
-    )
+    def method_function(cls, **kwargs):
+        if kwargs.get("method") is not None:
+            kwargs.pop("method")
+        return cls(method=method_name, **kwargs)
+
+    method_function.__name__ = method_name
     method_function.__doc__ = transform.__doc__
     setattr(
         transform,
         method_name,
-        classmethod(show_args(method_function, exclude_method=True)),
+        classmethod(set_signature(method_function, "cls", defaults)),
     )
 
 
 if "sphinx" not in sys.modules:
     for transform in transforms:
-        default_values = transform.get_default_values()
-        code = "super(self.__class__, self).__init__(**kwargs['arguments'])"
-        init = create_function(
-            "temp", "self", default_values, tuple(default_values.values()), code
-        )
-        transform.__init__ = show_args(init)
+        transform.__init__ = create_init(transform.get_default_values())
 
         for method in transform.get_methods():
             default_values = transform.get_default_values(method=method)
@@ -1,4 +1,5 @@
 import cv2
+import numpy as np
 
 from easycv.operation import Operation
 from easycv.errors import (
@@ -8,10 +9,30 @@ from easycv.errors import (
 )
 
 
+# Types supported by cv2.minMaxLoc (min and max in a single pass)
+_min_max_types = {
+    np.dtype(t)
+    for t in ("uint8", "int8", "uint16", "int16", "int32", "float32", "float64")
+}
+
+
+def _value_range(array):
+    if array.dtype in _min_max_types and array.flags.c_contiguous and array.size:
+        return cv2.minMaxLoc(array.reshape(-1, 1))[:2]
+    return array.min(), array.max()
+
+
 class Metadata(type):
     exclude = {
         "run",
         "process",
+        "process_batch",
+        "pointwise",
+        "modifies_input",
+        "supports_dst",
+        "output_range",
+        "preserves_shape",
+        "batch_size",
         "arguments",
         "outputs",
         "method_name",
@@ -27,6 +48,12 @@ class Transform(Operation, metaclass=Metadata):
     methods = None
     default_method = None
     method_name = "method"
+    batch_size = None  # Default batch size (transforms that can process batches)
+    pointwise = False  # Each output pixel only depends on the same input pixel value
+    modifies_input = False  # process writes into the given image
+    supports_dst = False  # process can write its result into a given array (dst)
+    output_range = None  # (min, max) of process outputs if known (skips the scan)
+    preserves_shape = False  # outputs always have the same shape as the input
 
     def __init__(self, **kwargs):
         self._method = self._extract_method(kwargs)
@@ -46,22 +73,46 @@ class Transform(Operation, metaclass=Metadata):
             validator.check(arg, kwargs[arg])
             self._args[arg] = kwargs[arg]
 
-    def __call__(self, image, forwarded=None):
-        output = self.run(image, forwarded=forwarded)
-
+    def __call__(self, image, forwarded=None, dst=None):
+        return self._format_output(self.run(image, forwarded=forwarded, dst=dst))
+
+    def batch(self, images):
+        """
+        Applies the transform to a list of image arrays at once and returns a list with the \
+        outputs for each image, in the same order and format as calling the transform on each \
+        image. Transforms that can process several images together (like neural networks) \
+        override `process_batch`, for the others this is the same as applying the transform to \
+        each image.
+
+        :param images: List of images represented as arrays
+        :type images: :class:`list`
+        :return: Outputs for each image
+        :rtype: :class:`list`
+        """
+        return [self._format_output(output) for output in self.run_batch(images)]
+
+    def _format_output(self, output):
         if isinstance(output, dict):
             return output
-        else:
-            if output.min() >= 0 and output.max() <= 255:
-                if output.dtype.kind != "i":
-                    if output.min() >= 0 and output.max() <= 1:
+
+        if output.dtype != np.uint8:
+            if self.output_range is not None:
+                low, high = self.output_range
+            else:
+                low, high = _value_range(output)
+
+            if low >= 0 and high <= 255:
+                if output.dtype.kind == "b":
+                    output = output.view("uint8") * 255
+                elif output.dtype.kind != "i":
+                    if high <= 1:
                         output = output * 255
-                    output = output.astype("uint8")
+                    output = output.astype("uint8", copy=False)
             else:
                 output = cv2.normalize(output, None, 0, 255, cv2.NORM_MINMAX).astype(
                     "uint8"
                 )
-            return {"image": output}
+        return {"image": output}
 
     def __eq__(self, other):
         return isinstance(other, Transform) and self.args == other.args
@@ -143,15 +194,38 @@ class Transform(Operation, metaclass=Metadata):
         else:
             return None
 
+    def lookup_table(self):
+        """
+        Returns the lookup table of a pointwise transform (the output value for each one of the \
+        256 possible values of an uint8 image). Pipelines use these tables to apply chains of \
+        pointwise transforms in a single pass, so pointwise transforms must return uint8 images \
+        for uint8 inputs.
+
+        :return: Lookup table with 256 entries
+        :rtype: :class:`~numpy:numpy.ndarray`
+        """
+        values = np.arange(256, dtype="uint8").reshape(1, 256)
+        return self.run(values).reshape(256)
+
     def process(self, image, **kwargs):
         pass
 
-    def run(self, image, forwarded=None):
+    def process_batch(self, images, **kwargs):
+        return [self.process(image, **kwargs) for image in images]
+
+    def run(self, image, forwarded=None, dst=None):
         self.initialize()
-        if forwarded is None:
+        if forwarded is None and dst is None:
             args = self._args
         else:
             args = self._args.copy()
-            args.update(forwarded)
+            if forwarded is not None:
+                args.update(forwarded)
+            if dst is not None and self.supports_dst:
+                args["dst"] = dst
 
         return self.process(image, **args)
+
+    def run_batch(self, images):
+        self.initialize()
+        return self.process_batch(images, **self._args)
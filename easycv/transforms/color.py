@@ -1,13 +1,11 @@
 import cv2
 import numpy as np
-from sklearn.cluster import MiniBatchKMeans
 
-from color_transfer import color_transfer
 from easycv.validators import Option, List, Number, Image
 from easycv.transforms.base import Transform
 from easycv.transforms.selectors import Select
 from easycv.transforms.spatial import Crop
-from easycv.resources import get_resource
+from easycv.resources import register_network, use_network
 
 
 class GrayScale(Transform):
@@ -15,9 +13,11 @@ class GrayScale(Transform):
     GrayScale is a transform that turns an image into grayscale.
     """
 
+    supports_dst = True
+
     def process(self, image, **kwargs):
         if len(image.shape) == 3:
-            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=kwargs.get("dst"))
         else:
             return image
 
@@ -43,6 +43,9 @@ class FilterChannels(Transform):
     :type scheme: :class:`str`, optional
     """
 
+    modifies_input = True
+    preserves_shape = True
+
     arguments = {
         "channels": List(Number(min_value=0, max_value=2, only_integer=True)),
         "scheme": Option(["rgb", "bgr"], default=0),
@@ -65,6 +68,10 @@ class GammaCorrection(Transform):
     :type gamma: :class:`Float`
     """
 
+    pointwise = True
+    preserves_shape = True
+    supports_dst = True
+
     arguments = {
         "gamma": Number(min_value=1e-30, default=1),
     }
@@ -73,7 +80,7 @@ class GammaCorrection(Transform):
         table = np.array(
             [((i / 255.0) ** (1.0 / kwargs["gamma"])) * 255 for i in np.arange(0, 256)]
         ).astype("uint8")
-        return cv2.LUT(image, table)
+        return cv2.LUT(image, table, dst=kwargs.get("dst"))
 
 
 class Negative(Transform):
@@ -81,6 +88,9 @@ class Negative(Transform):
     Negative is a transform that inverts color and brightness in an image.
     """
 
+    pointwise = True
+    preserves_shape = True
+
     def process(self, image, **kwargs):
         return 255 - image
 
@@ -131,6 +141,8 @@ class ColorTransfer(Transform):
     }
 
     def process(self, image, **kwargs):
+        from color_transfer import color_transfer
+
         return color_transfer(kwargs["source"].array, image)
 
 
@@ -160,12 +172,18 @@ class Contrast(Transform):
     :type alpha: :class:`float`
     """
 
+    pointwise = True
+    preserves_shape = True
+    supports_dst = True
+
     arguments = {
         "alpha": Number(only_integer=False),
     }
 
     def process(self, image, **kwargs):
-        image = cv2.addWeighted(image, kwargs["alpha"], image, 0, 0)
+        image = cv2.addWeighted(
+            image, kwargs["alpha"], image, 0, 0, dst=kwargs.get("dst")
+        )
         return image
 
 
@@ -177,12 +195,18 @@ class Brightness(Transform):
     :type beta: :class:`int`
     """
 
+    pointwise = True
+    preserves_shape = True
+    supports_dst = True
+
     arguments = {
         "beta": Number(only_integer=True),
     }
 
     def process(self, image, **kwargs):
-        image = cv2.addWeighted(image, 1, image, 0, kwargs["beta"])
+        image = cv2.addWeighted(
+            image, 1, image, 0, kwargs["beta"], dst=kwargs.get("dst")
+        )
         return image
 
 
@@ -191,8 +215,10 @@ class Hsv(Transform):
     Hsv is a transform that turns an image to hsv
     """
 
+    supports_dst = True
+
     def process(self, image, **kwargs):
-        return cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2HSV, dst=kwargs.get("dst"))
 
 
 class ColorPick(Transform):
@@ -223,37 +249,62 @@ class ColorPick(Transform):
             }
 
 
+def _load_colorization_network(proto, model, points):
+    net = cv2.dnn.readNetFromCaffe(proto, model)
+    class8 = net.getLayerId("class8_ab")
+    conv8 = net.getLayerId("conv8_313_rh")
+    points = np.load(points).transpose().reshape(2, 313, 1, 1)
+    net.getLayer(class8).blobs = [points.astype("float32")]
+    net.getLayer(conv8).blobs = [np.full([1, 313], 2.606, dtype="float32")]
+    return net
+
+
+register_network(
+    "colorization_zhang",
+    "colorization_zhang",
+    [
+        "colorization_deploy_v2.prototxt",
+        "colorization_release_v2.caffemodel",
+        "pts_in_hull.npy",
+    ],
+    _load_colorization_network,
+)
+
+
 class Colorize(Transform):
     """
     Colorize is a transform that puts the color in a grayscale image
     """
 
-    def process(self, image, **kwargs):
-        image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-
-        proto = get_resource("colorization_zhang", "colorization_deploy_v2.prototxt")
-        model = get_resource("colorization_zhang", "colorization_release_v2.caffemodel")
-        pts = np.load(str(get_resource("colorization_zhang", "pts_in_hull.npy")))
-
-        net = cv2.dnn.readNetFromCaffe(str(proto), str(model))
-        class8 = net.getLayerId("class8_ab")
-        conv8 = net.getLayerId("conv8_313_rh")
-        pts = pts.transpose().reshape(2, 313, 1, 1)
-        net.getLayer(class8).blobs = [pts.astype("float32")]
-        net.getLayer(conv8).blobs = [np.full([1, 313], 2.606, dtype="float32")]
-
-        scaled = image.astype("float32") / 255.0
-        lab = cv2.cvtColor(scaled, cv2.COLOR_BGR2LAB)
-        resized = cv2.resize(lab, (224, 224))
-        L = cv2.split(resized)[0] - 50
-        net.setInput(cv2.dnn.blobFromImage(L))
-        ab = net.forward()[0, :, :, :].transpose((1, 2, 0))
-        ab = cv2.resize(ab, (image.shape[1], image.shape[0]))
-        L = cv2.split(lab)[0]
+    batch_size = 8
 
-        colorized = np.concatenate((L[:, :, np.newaxis], ab), axis=2)
-        colorized = cv2.cvtColor(colorized, cv2.COLOR_LAB2BGR)
-        return (255 * np.clip(colorized, 0, 1)).astype("uint8")
+    def process(self, image, **kwargs):
+        return self.process_batch([image], **kwargs)[0]
+
+    def process_batch(self, images, **kwargs):
+        labs = []
+        lightness = []
+        for image in images:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+            scaled = image.astype("float32") / 255.0
+            lab = cv2.cvtColor(scaled, cv2.COLOR_BGR2LAB)
+            resized = cv2.resize(lab, (224, 224))
+            labs.append(lab)
+            lightness.append(cv2.split(resized)[0] - 50)
+
+        with use_network("colorization_zhang") as net:
+            net.setInput(cv2.dnn.blobFromImages(lightness))
+            predictions = net.forward().transpose((0, 2, 3, 1))
+
+        colorized_images = []
+        for lab, ab in zip(labs, predictions):
+            ab = cv2.resize(ab, (lab.shape[1], lab.shape[0]))
+            L = cv2.split(lab)[0]
+
+            colorized = np.concatenate((L[:, :, np.newaxis], ab), axis=2)
+            colorized = cv2.cvtColor(colorized, cv2.COLOR_LAB2BGR)
+            colorized_images.append((255 * np.clip(colorized, 0, 1)).astype("uint8"))
+        return colorized_images
 
 
 class Quantitization(Transform):
@@ -269,6 +320,8 @@ class Quantitization(Transform):
     }
 
     def process(self, image, **kwargs):
+        from sklearn.cluster import MiniBatchKMeans
+
         (h, w) = image.shape[:2]
         image = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
         image = image.reshape((image.shape[0] * image.shape[1], 3))
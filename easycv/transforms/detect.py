@@ -1,22 +1,29 @@
+import threading
+from functools import lru_cache
+
 import cv2
 import numpy as np
 
 from easycv.transforms.base import Transform
 from easycv.transforms.color import GrayScale
-from easycv.transforms.spatial import Crop
 from easycv.transforms.edges import Canny
-from easycv.resources import get_resource
+from easycv.resources import get_resource, register_network, use_network
 import easycv.transforms.filter
 from easycv.validators import Type, List, Number, File
 
 
-try:
-    from pyzbar import pyzbar
-except ImportError:
-    raise ImportError(
-        "Error importing pyzbar. Make sure you have zbar installed on your system. "
-        + "On linux you can simply run 'sudo apt-get install libzbar0'"
-    )
+register_network(
+    "yolov3",
+    "yolov3",
+    ["yolov3.cfg", "yolov3.weights"],
+    cv2.dnn.readNetFromDarknet,
+)
+register_network(
+    "ssd-mobilenet",
+    "ssd-mobilenet",
+    ["MobileNetSSD_deploy.prototxt", "MobileNetSSD_deploy.caffemodel"],
+    cv2.dnn.readNetFromCaffe,
+)
 
 
 class Scan(Transform):
@@ -35,6 +42,14 @@ class Scan(Transform):
     }
 
     def process(self, image, **kwargs):
+        try:
+            from pyzbar import pyzbar
+        except ImportError:
+            raise ImportError(
+                "Error importing pyzbar. Make sure you have zbar installed on your system. "
+                + "On linux you can simply run 'sudo apt-get install libzbar0'"
+            )
+
         data = []
         rectangles = []
         decoded = pyzbar.decode(image)
@@ -47,6 +62,88 @@ class Scan(Transform):
         return {"detections": len(decoded), "data": data, "rectangles": rectangles}
 
 
+_cascades = {}
+_cascades_lock = threading.Lock()
+
+
+def load_cascade(cascade_file):
+    """
+    Returns the cascade classifier stored in the given file together with the lock that must be \
+    held while using it. Classifiers are only loaded the first time they are requested.
+
+    :param cascade_file: Path to the cascade file
+    :type cascade_file: :class:`str`
+    :return: Cascade classifier and its lock
+    :rtype: :class:`tuple`
+    """
+    cascade_file = str(cascade_file)
+    with _cascades_lock:
+        if cascade_file not in _cascades:
+            _cascades[cascade_file] = (
+                cv2.CascadeClassifier(cascade_file),
+                threading.Lock(),
+            )
+        return _cascades[cascade_file]
+
+
+@lru_cache(maxsize=None)
+def _cascade_resource(resource_name, filename):
+    return str(get_resource(resource_name, filename))
+
+
+def _detect_cascade(
+    cascade_file, gray, scale, min_neighbors, min_size="auto", max_size="auto"
+):
+    cascade, lock = load_cascade(cascade_file)
+    with lock:
+        detections = cascade.detectMultiScale(
+            gray,
+            scaleFactor=scale,
+            minNeighbors=min_neighbors,
+            minSize=min_size if min_size != "auto" else None,
+            maxSize=max_size if max_size != "auto" else None,
+        )
+
+    rectangles = []
+    for x, y, w, h in detections:
+        rectangles.append([(x, y), (x + w, y + h)])
+    return rectangles
+
+
+def _detect_faces(gray, scale=1.3, min_neighbors=5):
+    cascade_file = _cascade_resource(
+        "haar-face-cascade", "haarcascade_frontalface_default.xml"
+    )
+    return _detect_cascade(cascade_file, gray, scale, min_neighbors)
+
+
+def _detect_inside_faces(gray, faces, cascade_file, scale, min_neighbors, limit=None):
+    rectangles = []
+    for face in faces:
+        (lx, ty), (rx, by) = face
+        detections = _detect_cascade(
+            cascade_file, gray[ty:by, lx:rx], scale, min_neighbors
+        )
+        for detection in detections[:limit]:
+            adjusted = []
+            for i in range(len(detection)):
+                adjusted.append((detection[i][0] + lx, detection[i][1] + ty))
+            rectangles.append(adjusted)
+    return rectangles
+
+
+def _detect_eyes(gray, faces, scale=1.1, min_neighbors=3):
+    cascade_file = _cascade_resource("haar-eye-cascade", "haarcascade_eye.xml")
+    return _detect_inside_faces(gray, faces, cascade_file, scale, min_neighbors)
+
+
+def _detect_smiles(gray, faces, scale=1.2, min_neighbors=20):
+    cascade_file = _cascade_resource("haar-smile-cascade", "haarcascade_smile.xml")
+    return _detect_inside_faces(
+        gray, faces, cascade_file, scale, min_neighbors, limit=1
+    )
+
+
 class CascadeDetector(Transform):
 
     arguments = {
@@ -64,20 +161,15 @@ class CascadeDetector(Transform):
     }
 
     def process(self, image, **kwargs):
-        cascade = cv2.CascadeClassifier(kwargs["cascade"])
         gray = GrayScale().apply(image)
-        detections = cascade.detectMultiScale(
+        rectangles = _detect_cascade(
+            kwargs["cascade"],
             gray,
-            scaleFactor=kwargs["scale"],
-            minNeighbors=kwargs["min_neighbors"],
-            minSize=kwargs["min_size"] if kwargs["min_size"] != "auto" else None,
-            maxSize=kwargs["max_size"] if kwargs["max_size"] != "auto" else None,
+            kwargs["scale"],
+            kwargs["min_neighbors"],
+            min_size=kwargs["min_size"],
+            max_size=kwargs["max_size"],
         )
-
-        rectangles = []
-        for x, y, w, h in detections:
-            rectangles.append([(x, y), (x + w, y + h)])
-
         return {"rectangles": rectangles}
 
 
@@ -95,10 +187,8 @@ class Faces(Transform):
     }
 
     def process(self, image, **kwargs):
-        cascade_file = get_resource(
-            "haar-face-cascade", "haarcascade_frontalface_default.xml"
-        )
-        return CascadeDetector(cascade=str(cascade_file), **kwargs).apply(image)
+        gray = GrayScale().apply(image)
+        return {"rectangles": _detect_faces(gray, **kwargs)}
 
 
 class Eyes(Transform):
@@ -115,21 +205,8 @@ class Eyes(Transform):
     }
 
     def process(self, image, **kwargs):
-        cascade_file = get_resource("haar-eye-cascade", "haarcascade_eye.xml")
-
-        rectangles = []
-        for face in Faces().apply(image)["rectangles"]:
-            face_image = Crop(rectangle=face).apply(image)
-            eyes = CascadeDetector(cascade=str(cascade_file), **kwargs).apply(
-                face_image
-            )["rectangles"]
-            for eye in eyes:
-                adjusted = []
-                for i in range(len(eye)):
-                    adjusted.append((eye[i][0] + face[0][0], eye[i][1] + face[0][1]))
-                rectangles.append(adjusted)
-
-        return {"rectangles": rectangles}
+        gray = GrayScale().apply(image)
+        return {"rectangles": _detect_eyes(gray, _detect_faces(gray), **kwargs)}
 
 
 class Smile(Transform):
@@ -146,22 +223,38 @@ class Smile(Transform):
     }
 
     def process(self, image, **kwargs):
-        faces = Faces().apply(image)
-        cascade_file = get_resource("haar-smile-cascade", "haarcascade_smile.xml")
-        rectangles = []
-        for face in faces["rectangles"]:
-            face_image = Crop(rectangle=face).apply(image)
-            smile = CascadeDetector(cascade=str(cascade_file), **kwargs).apply(
-                face_image
-            )["rectangles"]
-            if smile:
-                adjusted = []
-                for i in range(len(smile[0])):
-                    adjusted.append(
-                        (smile[0][i][0] + face[0][0], smile[0][i][1] + face[0][1])
-                    )
-                rectangles.append(adjusted)
-        return {"rectangles": rectangles}
+        gray = GrayScale().apply(image)
+        return {"rectangles": _detect_smiles(gray, _detect_faces(gray), **kwargs)}
+
+
+class FaceFeatures(Transform):
+    """
+    FaceFeatures is a transform that detects faces and the eyes and smiles inside them in a \
+    single pass. The image is only converted to grayscale and scanned for faces once, eyes and \
+    smiles are then searched inside each detected face. The results are the same as applying \
+    :class:`Faces`, :class:`Eyes` and :class:`Smile` separately.
+    """
+
+    outputs = {
+        "faces": List(
+            List(List(Number(min_value=0, only_integer=True), length=2), length=2)
+        ),
+        "eyes": List(
+            List(List(Number(min_value=0, only_integer=True), length=2), length=2)
+        ),
+        "smiles": List(
+            List(List(Number(min_value=0, only_integer=True), length=2), length=2)
+        ),
+    }
+
+    def process(self, image, **kwargs):
+        gray = GrayScale().apply(image)
+        faces = _detect_faces(gray)
+        return {
+            "faces": faces,
+            "eyes": _detect_eyes(gray, faces),
+            "smiles": _detect_smiles(gray, faces),
+        }
 
 
 class Lines(Transform):
@@ -317,6 +410,7 @@ class Detect(Transform):
         "ssd": {"arguments": ["confidence"]},
     }
     default_method = "yolo"
+    batch_size = 8
 
     arguments = {
         "confidence": Number(min_value=0, max_value=1, default=0.5),
@@ -334,6 +428,7 @@ class Detect(Transform):
     }
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def labels(model):
         if model == "yolo":
             labels_path = get_resource("yolov3", "coco.names")
@@ -365,90 +460,111 @@ class Detect(Transform):
         return labels
 
     def process(self, image, **kwargs):
+        return self.process_batch([image], **kwargs)[0]
+
+    def process_batch(self, images, **kwargs):
         labels = self.labels(kwargs["method"])
         colors = np.random.randint(0, 255, size=(len(labels), 3), dtype="uint8")
 
         if kwargs["method"] == "yolo":
-            config = get_resource("yolov3", "yolov3.cfg")
-            weights = get_resource("yolov3", "yolov3.weights")
-
-            net = cv2.dnn.readNetFromDarknet(str(config), str(weights))
-
-            layers = net.getLayerNames()
-            layers = [layers[i[0] - 1] for i in net.getUnconnectedOutLayers()]
-
-            blob = cv2.dnn.blobFromImage(
-                image, 1 / 255.0, (416, 416), swapRB=True, crop=False
+            blob = cv2.dnn.blobFromImages(
+                images, 1 / 255.0, (416, 416), swapRB=True, crop=False
             )
 
-            h, w = image.shape[:2]
-            net.setInput(blob)
-            outputs = net.forward(layers)
-
-            rectangles = []
-            confidences = []
-            class_ids = []
-
-            for output in outputs:
-                for detection in output:
-                    scores = detection[5:]
-                    class_id = np.argmax(scores)
-                    confidence = scores[class_id]
-
-                    if confidence > kwargs["confidence"]:
-                        # scale the bounding box back
-                        rectangle = detection[0:4] * np.array([w, h, w, h])
-                        (centerX, centerY, width, height) = rectangle.astype("int")
-
-                        # compute top-left corner
-                        x = int(centerX - (width / 2))
-                        y = int(centerY - (height / 2))
-
-                        rectangles.append([x, y, int(width), int(height)])
-                        confidences.append(float(confidence))
-                        class_ids.append(class_id)
-
-            # apply non-maximum suppression
-            indexes_to_keep = cv2.dnn.NMSBoxes(
-                rectangles, confidences, kwargs["confidence"], kwargs["threshold"]
-            )
+            with use_network("yolov3") as net:
+                net.setInput(blob)
+                outputs = net.forward(net.getUnconnectedOutLayersNames())
 
-            boxes = []
-            if len(indexes_to_keep) > 0:
-                for i in indexes_to_keep.flatten():
-                    (x, y) = (rectangles[i][0], rectangles[i][1])
-                    (w, h) = (rectangles[i][2], rectangles[i][3])
-                    color = [int(c) for c in colors[class_ids[i]]]
-                    label = "{}: {:.4f}".format(
-                        labels[int(class_ids[i])], confidences[i]
-                    )
-                    boxes.append([[(x, y), (w, h)], color, label])
-
-            return {"boxes": boxes}
+            # split the outputs of each layer by image
+            outputs = [
+                output.reshape(len(images), -1, output.shape[-1]) for output in outputs
+            ]
+            return [
+                self._yolo_boxes(
+                    [output[i] for output in outputs],
+                    images[i].shape[:2],
+                    labels,
+                    colors,
+                    kwargs["confidence"],
+                    kwargs["threshold"],
+                )
+                for i in range(len(images))
+            ]
         else:
-            prototxt = get_resource("ssd-mobilenet", "MobileNetSSD_deploy.prototxt")
-            model = get_resource("ssd-mobilenet", "MobileNetSSD_deploy.caffemodel")
-            net = cv2.dnn.readNetFromCaffe(str(prototxt), str(model))
-
-            (h, w) = image.shape[:2]
-            blob = cv2.dnn.blobFromImage(
-                cv2.resize(image, (300, 300)), 0.007843, (300, 300), 127.5
+            blob = cv2.dnn.blobFromImages(
+                [cv2.resize(image, (300, 300)) for image in images],
+                0.007843,
+                (300, 300),
+                127.5,
             )
-            net.setInput(blob)
-            detections = net.forward()
+            with use_network("ssd-mobilenet") as net:
+                net.setInput(blob)
+                detections = net.forward()
+
+            # each detection starts with the index of the image in the batch
+            detections = detections.reshape(-1, 7)
+            return [
+                self._ssd_boxes(
+                    detections[detections[:, 0] == i],
+                    images[i].shape[:2],
+                    labels,
+                    colors,
+                    kwargs["confidence"],
+                )
+                for i in range(len(images))
+            ]
 
-            boxes = []
-            for i in np.arange(0, detections.shape[2]):
-                confidence = detections[0, 0, i, 2]
+    @staticmethod
+    def _yolo_boxes(outputs, shape, labels, colors, min_confidence, threshold):
+        h, w = shape
+        detections = np.concatenate(outputs)
+        scores = detections[:, 5:]
+        class_ids = scores.argmax(axis=1)
+        confidences = scores[np.arange(len(scores)), class_ids]
+
+        keep = confidences > min_confidence
+        detections = detections[keep]
+        class_ids = class_ids[keep]
+        confidences = confidences[keep]
+
+        # scale the bounding boxes back and compute the top-left corners
+        rectangles = (detections[:, :4] * np.array([w, h, w, h])).astype("int")
+        rectangles[:, :2] = (rectangles[:, :2] - rectangles[:, 2:] / 2).astype("int")
+
+        # apply non-maximum suppression
+        indexes_to_keep = cv2.dnn.NMSBoxes(
+            rectangles, confidences, min_confidence, threshold
+        )
+        indexes_to_keep = np.array(indexes_to_keep, dtype="int").flatten()
+
+        boxes = []
+        for (x, y, w, h), class_id, confidence in zip(
+            rectangles[indexes_to_keep].tolist(),
+            class_ids[indexes_to_keep].tolist(),
+            confidences[indexes_to_keep].tolist(),
+        ):
+            color = [int(c) for c in colors[class_id]]
+            label = "{}: {:.4f}".format(labels[class_id], confidence)
+            boxes.append([[(x, y), (w, h)], color, label])
 
-                if confidence > kwargs["confidence"]:
-                    idx = int(detections[0, 0, i, 1])
-                    box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
-                    (startX, startY, endX, endY) = box.astype("int")
-                    width, height = int(endX - startX), int(endY - startY)
-                    label = "{}: {:.4f}".format(labels[idx], confidence)
-                    color = [int(c) for c in colors[idx]]
+        return {"boxes": boxes}
 
-                    boxes.append([[(startX, startY), (width, height)], color, label])
+    @staticmethod
+    def _ssd_boxes(detections, shape, labels, colors, min_confidence):
+        (h, w) = shape
+        detections = detections[detections[:, 2] > min_confidence]
+        corners = (detections[:, 3:7] * np.array([w, h, w, h])).astype("int")
+
+        boxes = []
+        for (startX, startY, endX, endY), idx, confidence in zip(
+            corners.tolist(),
+            detections[:, 1].astype("int").tolist(),
+            detections[:, 2].tolist(),
+        ):
+            label = "{}: {:.4f}".format(labels[idx], confidence)
+            color = [int(c) for c in colors[idx]]
+            boxes.append(
+                [[(startX, startY), (endX - startX, endY - startY)], color, label]
+            )
 
-            return {"boxes": boxes}
+        return {"boxes": boxes}
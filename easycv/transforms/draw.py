@@ -60,6 +60,9 @@ class Draw(Transform):
     :type x_mirror: :class:`bool`
     """
 
+    modifies_input = True
+    preserves_shape = True
+
     methods = {
         "ellipse": {
             "arguments": [
@@ -1,6 +1,5 @@
 import cv2
 import numpy as np
-from skimage.filters import unsharp_mask
 
 from easycv.transforms.base import Transform
 from easycv.transforms.color import GrayScale
@@ -38,6 +37,8 @@ class Blur(Transform):
         "bilateral": {"arguments": ["size", "sigma_color", "sigma_space"]},
     }
     default_method = "gaussian"
+    supports_dst = True
+    preserves_shape = True
 
     arguments = {
         "size": Number(min_value=1, only_integer=True, only_odd=True, default="auto"),
@@ -49,20 +50,29 @@ class Blur(Transform):
 
     def process(self, image, **kwargs):
         if kwargs["method"] == "uniform":
-            return cv2.blur(image, (kwargs["size"], kwargs["size"]))
+            return cv2.blur(
+                image, (kwargs["size"], kwargs["size"]), dst=kwargs.get("dst")
+            )
         elif kwargs["method"] == "gaussian":
             if kwargs["size"] == "auto":
                 kwargs["size"] = 2 * int(kwargs["sigma"] * kwargs["truncate"] + 0.5) + 1
             return cv2.GaussianBlur(
-                image, (kwargs["size"], kwargs["size"]), kwargs["sigma"]
+                image,
+                (kwargs["size"], kwargs["size"]),
+                kwargs["sigma"],
+                dst=kwargs.get("dst"),
             )
         elif kwargs["method"] == "median":
-            return cv2.medianBlur(image, kwargs["size"])
+            return cv2.medianBlur(image, kwargs["size"], dst=kwargs.get("dst"))
         else:
             if kwargs["size"] == "auto":
                 kwargs["size"] = 5
             return cv2.bilateralFilter(
-                image, kwargs["size"], kwargs["sigma_color"], kwargs["sigma_space"]
+                image,
+                kwargs["size"],
+                kwargs["sigma_color"],
+                kwargs["sigma_space"],
+                dst=kwargs.get("dst"),
             )
 
 
@@ -140,4 +150,6 @@ class Sharpen(Transform):
 
     def process(self, image, **kwargs):
         kwargs["radius"] = kwargs.pop("sigma")
+        from skimage.filters import unsharp_mask
+
         return unsharp_mask(image, preserve_range=True, **kwargs)
@@ -16,6 +16,9 @@ class Erode(Transform):
     :type iterations: :class:`int`, optional
     """
 
+    supports_dst = True
+    preserves_shape = True
+
     arguments = {
         "size": Number(min_value=1, only_integer=True, only_odd=True, default=5),
         "iterations": Number(min_value=1, only_integer=True, default=1),
@@ -23,7 +26,9 @@ class Erode(Transform):
 
     def process(self, image, **kwargs):
         kernel = np.ones((kwargs["size"], kwargs["size"]), np.uint8)
-        return cv2.erode(image, kernel, iterations=kwargs["iterations"])
+        return cv2.erode(
+            image, kernel, dst=kwargs.get("dst"), iterations=kwargs["iterations"]
+        )
 
 
 class Dilate(Transform):
@@ -36,6 +41,9 @@ class Dilate(Transform):
     :type iterations: :class:`int`, optional
     """
 
+    supports_dst = True
+    preserves_shape = True
+
     arguments = {
         "size": Number(min_value=1, only_integer=True, only_odd=True, default=5),
         "iterations": Number(min_value=1, only_integer=True, default=1),
@@ -43,7 +51,9 @@ class Dilate(Transform):
 
     def process(self, image, **kwargs):
         kernel = np.ones((kwargs["size"], kwargs["size"]), np.uint8)
-        return cv2.dilate(image, kernel, iterations=kwargs["iterations"])
+        return cv2.dilate(
+            image, kernel, dst=kwargs.get("dst"), iterations=kwargs["iterations"]
+        )
 
 
 class Morphology(Transform):
@@ -62,6 +72,9 @@ class Morphology(Transform):
     :type iterations: :class:`int`, optional
     """
 
+    supports_dst = True
+    preserves_shape = True
+
     arguments = {
         "size": Number(min_value=1, only_integer=True, only_odd=True, default=5),
         "iterations": Number(min_value=1, only_integer=True, default=1),
@@ -76,5 +89,6 @@ class Morphology(Transform):
             image,
             morp_methods[kwargs["method"]],
             kernel,
+            dst=kwargs.get("dst"),
             iterations=kwargs["iterations"],
         )
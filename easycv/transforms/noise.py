@@ -1,7 +1,6 @@
 from easycv.transforms.base import Transform
 
 from easycv.validators import Number, Type
-from skimage.util import random_noise
 
 
 class Noise(Transform):
@@ -45,6 +44,7 @@ class Noise(Transform):
     }
     method_name = "mode"
     default_method = "gaussian"
+    preserves_shape = True
 
     arguments = {
         "seed": Number(min_value=0, max_value=2 ** 32 - 1, default=False),
@@ -55,10 +55,16 @@ class Noise(Transform):
         "salt_vs_pepper": Number(min_value=0, max_value=1, default=0.5),
     }
 
+    @property
+    def output_range(self):
+        return (0, 1) if self._args["clip"] else None
+
     def process(self, image, **kwargs):
         kwargs["seed"] = kwargs["seed"] if kwargs["seed"] else None
         if kwargs["mode"] == "gaussian":
             kwargs["var"] = kwargs["var"] / 255
         if kwargs["mode"] == "sp":
             kwargs["mode"] = "s&p"
+        from skimage.util import random_noise
+
         return random_noise(image, **kwargs)
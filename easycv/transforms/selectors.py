@@ -2,9 +2,6 @@ import os
 
 import cv2
 import numpy as np
-import matplotlib as mpl
-import matplotlib.pyplot as plt
-from matplotlib.widgets import RectangleSelector, EllipseSelector
 
 import easycv.image
 from easycv.transforms.base import Transform
@@ -111,8 +108,13 @@ class Select(Transform):
 
             return {"mask": easycv.image.Image(mask)}
 
+        import matplotlib as mpl
+
         mpl.use("Qt5Agg")
 
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import RectangleSelector, EllipseSelector
+
         fig, current_ax = plt.subplots()
         plt.tick_params(
             axis="both",
@@ -28,6 +28,7 @@ class Resize(Transform):
 
     methods = ["auto", "nearest", "linear", "area", "cubic", "lanczos4"]
     default_method = "auto"
+    supports_dst = True
     arguments = {
         "width": Number(min_value=0, only_integer=True),
         "height": Number(min_value=0, only_integer=True),
@@ -43,6 +44,7 @@ class Resize(Transform):
         return cv2.resize(
             image,
             (kwargs["width"], kwargs["height"]),
+            dst=kwargs.get("dst"),
             interpolation=interpolation_methods[kwargs["method"]],
         )
 
@@ -67,6 +69,7 @@ class Rescale(Transform):
 
     methods = ["auto", "nearest", "linear", "area", "cubic", "lanczos4"]
     default_method = "auto"
+    supports_dst = True
     arguments = {
         "fx": Number(min_value=0),
         "fy": Number(min_value=0),
@@ -84,6 +87,7 @@ class Rescale(Transform):
             (0, 0),
             fx=kwargs["fx"],
             fy=kwargs["fy"],
+            dst=kwargs.get("dst"),
             interpolation=interpolation_methods[kwargs["method"]],
         )
 
@@ -104,6 +108,8 @@ class Rotate(Transform):
     :type original: :class:`bool`, optional
     """
 
+    supports_dst = True
+
     arguments = {
         "degrees": Number(),
         "scale": Number(default=1),
@@ -134,7 +140,7 @@ class Rotate(Transform):
 
             w = n_w
 
-        return cv2.warpAffine(image, matrix, (w, h))
+        return cv2.warpAffine(image, matrix, (w, h), dst=kwargs.get("dst"))
 
 
 class Crop(Transform):
@@ -192,6 +198,9 @@ class Translate(Transform):
     :type y: :class:`int`, optional
     """
 
+    supports_dst = True
+    preserves_shape = True
+
     arguments = {
         "x": Number(min_value=0, only_integer=True, default=0),
         "y": Number(min_value=0, only_integer=True, default=0),
@@ -202,7 +211,7 @@ class Translate(Transform):
 
         matrix = np.float32([[1, 0, kwargs["x"]], [0, 1, kwargs["y"]]])
 
-        return cv2.warpAffine(image, matrix, (width, height))
+        return cv2.warpAffine(image, matrix, (width, height), dst=kwargs.get("dst"))
 
 
 class Mirror(Transform):
@@ -213,17 +222,20 @@ class Mirror(Transform):
     :type axis: :class:`str`, optional
     """
 
+    supports_dst = True
+    preserves_shape = True
+
     arguments = {
         "axis": Option(["both", "x", "y"], default=2),
     }
 
     def process(self, image, **kwargs):
         if kwargs["axis"] == "x":
-            return cv2.flip(image, 0)
+            return cv2.flip(image, 0, dst=kwargs.get("dst"))
         if kwargs["axis"] == "y":
-            return cv2.flip(image, 1)
+            return cv2.flip(image, 1, dst=kwargs.get("dst"))
         if kwargs["axis"] == "both":
-            return cv2.flip(image, -1)
+            return cv2.flip(image, -1, dst=kwargs.get("dst"))
 
 
 class Paste(Transform):
@@ -236,6 +248,9 @@ class Paste(Transform):
     :type rectangle: :class:`list`, required
     """
 
+    modifies_input = True
+    preserves_shape = True
+
     arguments = {
         "paste": Image(),
         "rectangle": List(
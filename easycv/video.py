@@ -8,6 +8,9 @@ from os.path import relpath
 import os
 import shutil
 
+from easycv.pipeline import Pipeline
+from easycv.scratch import get_scratch_folder
+
 
 def generate_ffmpeg_cmd(width, height, fps, preset):
     ffmpeg_bin = "ffmpeg"
@@ -67,8 +70,18 @@ class Video:
         chunks.append([int(previous + 1), int(total)])
         return chunks
 
+    @staticmethod
+    def _read_frames(cap, count):
+        for _ in range(count):
+            _, frame = cap.read()
+
+            if frame is None:
+                break
+
+            yield frame
+
     def _process_chunk(self, info):
-        cache_folder = Path(__file__).parent.absolute() / "cache"
+        cache_folder = Path(info["folder"])
         cap = cv2.VideoCapture(self.path)
         cap.set(cv2.CAP_PROP_POS_FRAMES, info["start"])
 
@@ -84,19 +97,18 @@ class Video:
             stderr=sp.PIPE,
         )
 
-        processed_frames = 0
-        while processed_frames <= (info["end"] - info["start"]):
-            _, frame = cap.read()
-
-            if frame is None:
-                break
+        transform = info["transform"]
+        if not isinstance(transform, Pipeline):
+            transform = Pipeline([transform])
 
-            frame = info["transform"].apply(frame)
+        # frames are written before the next one is read, so every buffer can be reused
+        frames = self._read_frames(cap, info["end"] - info["start"] + 1)
+        for output in transform.stream(frames, reuse_output=True):
+            frame = output["image"]
             if len(frame.shape) == 2:
                 frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
 
             pipe.stdin.write(frame.tobytes())
-            processed_frames += 1
 
         cap.release()
         pipe.communicate(b"q")
@@ -104,8 +116,8 @@ class Video:
         return None
 
     def apply(self, transform, num_processes=2, preset="medium", in_place=False):
-        cache_folder = Path(__file__).parent.absolute() / "cache"
-        cache_folder.mkdir(exist_ok=True)
+        # workers receive the folder, they may not share this process scratch folder
+        cache_folder = Path(get_scratch_folder())
 
         cap = cv2.VideoCapture(self.path)
         _, first_frame = cap.read()
@@ -131,6 +143,7 @@ class Video:
                 "transform": transform,
                 "name": name,
                 "cmd": cmd,
+                "folder": str(cache_folder),
             }
             info.append(chunk_info)
         p.map(self._process_chunk, info)
@@ -168,7 +181,7 @@ class Video:
     def save(self, filename):
         if self.temporary:
             self.temporary = False
-            os.rename(self.path, filename)
+            shutil.move(self.path, filename)
         else:
             try:
                 shutil.copy2(self.path, filename)
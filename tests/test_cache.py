@@ -0,0 +1,43 @@
+import numpy as np
+
+from easycv import Image, List
+from easycv.cache import ResultCache, fingerprint
+from easycv.transforms import Blur, GrayScale
+
+
+def test_fingerprint():
+    assert fingerprint(Blur(size=3)) == fingerprint(Blur(size=3))
+    assert fingerprint(Blur(size=3)) != fingerprint(Blur(size=5))
+
+
+def test_cache(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    test_list = List("tests/images", lazy=True)
+    first = test_list.apply(Blur(), cache=cache)
+    assert cache.size > 0
+    second = test_list.apply(Blur(), cache=cache)
+    assert all(a == b for a, b in zip(first, second))
+
+    computed = test_list.apply(GrayScale()).compute(in_place=False, cache=cache)
+    assert computed[0].channels == 1
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_key(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    image = Image(np.zeros((4, 4), "uint8"), lazy=True)
+    key = cache.key(image, Blur())
+    assert not image.loaded
+    loaded = Image(np.zeros((4, 4), "uint8"), lazy=True)
+    loaded.load()
+    assert key == cache.key(loaded, Blur())
+    assert key != cache.key(Image(np.ones((4, 4), "uint8"), lazy=True), Blur())
+
+
+def test_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), max_size=2000)
+    for i in range(10):
+        cache.put("{:040x}".format(i), bytes(500))
+    assert cache.size <= 2000
+    assert cache.get("{:040x}".format(9)) is not None
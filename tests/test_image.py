@@ -1,6 +1,13 @@
+import asyncio
+import warnings
+
+import numpy as np
+
+import easycv.image
 from easycv import Image, Pipeline
 from easycv.transforms.color import GrayScale, FilterChannels
 from easycv.transforms.filter import Blur
+from easycv.transforms.spatial import Resize, Rescale
 
 
 def test_image():
@@ -52,3 +59,71 @@ def test_apply():
     image2 = image.apply(Blur()).apply(GrayScale())
     image = image.apply(pipe)
     assert image == image2
+
+
+def test_encode_decode():
+    image = Image("tests/images/lenna.png")
+    for test_image in (image, image.apply(GrayScale())):
+        assert Image.decode(test_image.encode()) == test_image
+        assert Image.decode(test_image.encode(format="png")) == test_image
+
+
+def test_reduced_decode(tmp_path):
+    filename = str(tmp_path / "large.jpg")
+    Image("tests/images/lenna.png").apply(Rescale(fx=4, fy=3)).save(filename)
+    for transform in (Resize(width=300, height=200), Rescale(fx=0.2, fy=0.25)):
+        image = Image(filename, lazy=True).apply(transform)
+        full = Image(filename).apply(transform)
+        assert image.array.shape == full.array.shape
+        difference = np.abs(image.array.astype("int") - full.array.astype("int"))
+        assert difference.mean() < 2
+
+
+def test_reduced_decode_large(tmp_path, monkeypatch):
+    from PIL import Image as PILImage
+
+    # images over the pixel limit of PIL are still decoded at a reduced resolution
+    filename = str(tmp_path / "large.jpg")
+    Image("tests/images/lenna.png").apply(Rescale(fx=4, fy=4)).save(filename)
+    monkeypatch.setattr(PILImage, "MAX_IMAGE_PIXELS", 1000)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        image = Image(filename, lazy=True).apply(Resize(width=300, height=200))
+        assert image.array.shape == (200, 300, 3)
+
+
+def test_probe_shape():
+    image = Image("tests/images/lenna.png", lazy=True).apply(Blur())
+    assert (image.height, image.width, image.channels) == (512, 512, 3)
+    assert not image.loaded
+    image = image.apply(GrayScale())
+    assert image.channels == 1
+
+
+def test_probe_shape_large(monkeypatch):
+    from PIL import Image as PILImage
+
+    # the size of images over the pixel limit of PIL is still read from the header
+    monkeypatch.setattr(PILImage, "MAX_IMAGE_PIXELS", 1000)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        image = Image("tests/images/lenna.png", lazy=True)
+        assert (image.height, image.width) == (512, 512)
+        assert not image.loaded
+
+    # if the header can't be read the image is computed
+    monkeypatch.setattr(easycv.image, "probe_image", lambda path: None)
+    image = Image("tests/images/lenna.png", lazy=True)
+    assert image.width == 512 and image.loaded
+
+
+def test_async():
+    async def open_and_compute():
+        image = await Image.open_async("tests/images/lenna.png", lazy=True)
+        image = image.apply(GrayScale())
+        await image.load_async()
+        assert image.loaded
+        return await image.compute_async(in_place=False)
+
+    image = asyncio.get_event_loop().run_until_complete(open_and_compute())
+    assert image == Image("tests/images/lenna.png").apply(GrayScale())
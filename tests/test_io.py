@@ -0,0 +1,107 @@
+import os
+import threading
+from functools import partial
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+
+import numpy as np
+import pytest
+
+from easycv import List
+from easycv.errors import ImageDecodeError, ImageDownloadError
+from easycv.io import (
+    encode,
+    encode_image,
+    open_image,
+    is_container,
+    read_container,
+    write_container,
+    write_image,
+)
+from easycv.io.input import open_folder
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    handler = partial(QuietHandler, directory=os.path.join("tests", "images"))
+    httpd = HTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:{}/".format(httpd.server_address[1])
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_open_url(server):
+    assert open_image(server + "lenna.png").shape == (512, 512, 3)
+    with pytest.raises(ImageDownloadError):
+        open_image(server + "missing.png")
+
+
+def test_list_from_urls(server):
+    urls = [server + "lenna.png"] * 4
+    images = List(urls)
+    assert len(images) == 4
+    assert images[0] == images[3]
+    lazy_images = List(urls, lazy=True)
+    assert not lazy_images[0].loaded
+    assert lazy_images[0].array.shape == (512, 512, 3)
+
+
+def test_container(tmp_path):
+    arrays = [
+        open_image("tests/images/lenna.png"),
+        np.arange(12, dtype="float32").reshape(3, 4),
+    ]
+    filename = str(tmp_path / "images.ecv")
+    write_container(filename, arrays)
+    assert is_container(filename)
+    assert not is_container("tests/images/lenna.png")
+
+    loaded = read_container(filename)
+    assert all(
+        a.dtype == b.dtype and np.array_equal(a, b) for a, b in zip(arrays, loaded)
+    )
+    assert all(a.ctypes.data % 64 == 0 for a in loaded)
+
+
+def test_encoders(tmp_path):
+    array = open_image("tests/images/lenna.png")
+    for format, quality, compression in (
+        ("jpeg", 30, None),
+        ("webp", 30, None),
+        ("png", None, 0),
+        ("png", None, 9),
+    ):
+        data = encode(array, format, quality=quality, compression=compression)
+        assert encode_image(array, format, quality=quality or compression).endswith(
+            data
+        )
+        filename = str(tmp_path / ("image." + format))
+        write_image(array, filename, quality=quality, compression=compression)
+        with open(filename, "rb") as f:
+            assert f.read() == data
+    assert encode(array, "jpg", quality=30) == encode(array, "jpeg", quality=30)
+    assert len(encode(array, "png", compression=0)) > len(
+        encode(array, "png", compression=9)
+    )
+
+
+def test_open_folder(tmp_path):
+    with open("tests/images/lenna.png", "rb") as f:
+        data = f.read()
+    (tmp_path / "a.png").write_bytes(data)
+    (tmp_path / "b.png").write_bytes(data[:100])  # truncated image
+    (tmp_path / "notes.txt").write_text("not an image")
+
+    with pytest.warns(UserWarning, match="Failed to decode 1 image"):
+        images = open_folder(str(tmp_path))
+    assert len(images) == 1 and images[0].shape == (512, 512, 3)
+    with pytest.raises(ImageDecodeError):
+        open_folder(str(tmp_path), strict=True)
+    with pytest.raises(ImageDecodeError):
+        List(str(tmp_path), strict=True)
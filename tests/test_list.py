@@ -1,10 +1,30 @@
-from easycv import List
-from easycv.transforms import GrayScale, Blur
+import asyncio
+import os
+import warnings
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from easycv import Image, List
+from easycv.errors import InvalidArgumentError
+from easycv.executors import ImageFailure, RayExecutor, get_executor
+from easycv.transforms import GrayScale, Blur, FilterChannels
+from easycv.transforms.base import Transform
+from easycv.validators import Number
 
 testlist = List.random(2)
 lazy_test_list = List.random(2, lazy=True)
 
 
+def _distinct_images(count=7):
+    # tests/images only has one image, shifted and mirrored copies make every image different
+    lenna = Image("tests/images/lenna.png").array
+    return [
+        Image(np.roll(lenna[:, :: (-1) ** i], 16 * i, axis=0)) for i in range(count)
+    ]
+
+
 def test_random():
     test_list = testlist.copy()
     assert len(test_list) == 2
@@ -57,3 +77,259 @@ def parallel():
     assert test_list[0].pending.num_transforms() == 0
     assert len(test_list) == 2
     List.shutdown()
+
+
+def test_stream():
+    test_list = List("tests/images", lazy=True)
+    assert not test_list[0].loaded
+    images = list(test_list.apply(GrayScale()).stream(prefetch=2))
+    assert len(images) == len(test_list)
+    assert images[0].channels == 1
+    assert not test_list[0].loaded
+
+
+def test_dump(tmp_path):
+    test_list = List("tests/images", lazy=True).apply(GrayScale())
+    filename = str(tmp_path / "list.ecv")
+    test_list.dump(filename)
+    loaded = List(filename)
+    assert len(loaded) == len(test_list)
+    assert loaded[0] == test_list[0].compute(in_place=False)
+
+
+def test_async():
+    test_list = List("tests/images", lazy=True)
+    loop = asyncio.get_event_loop()
+    computed = loop.run_until_complete(
+        test_list.apply(GrayScale()).compute_async(in_place=False, limit=2)
+    )
+    assert all(image.channels == 1 for image in computed)
+    assert not test_list[0].loaded
+    applied = loop.run_until_complete(test_list.apply_async(Blur(), limit=2))
+    assert len(applied) == len(test_list)
+    assert not test_list[0].loaded
+    assert applied[0].loaded and applied[0].pending.num_transforms() == 0
+    assert applied[0] == List("tests/images")[0].apply(Blur())
+
+
+def test_save(tmp_path):
+    test_list = List("tests/images", lazy=True).apply(GrayScale())
+    filenames = test_list.save(str(tmp_path), pattern="image_{index:02d}", format="jpg")
+    assert len(filenames) == len(test_list)
+    assert filenames[0].endswith("image_00.jpg")
+    saved = List(str(tmp_path))
+    assert len(saved) == len(test_list)
+    assert saved[0].width == test_list[0].width
+
+
+def test_executors():
+    test_list = List(_distinct_images())
+    expected = test_list.apply(Blur())
+    for parallel in ("threads", "processes", "ray"):
+        outputs = test_list.apply(Blur(), parallel=parallel)
+        assert len(outputs) == len(expected)
+        assert all(outputs[i] == expected[i] for i in range(len(expected)))
+    List.shutdown()
+
+
+def test_chunks():
+    test_list = List(_distinct_images())
+    expected = test_list.apply(Blur())
+    lazy_list = List([Image(i.array, lazy=True) for i in test_list]).apply(Blur())
+    for parallel in ("threads", "processes", "ray"):
+        for chunk_size in (None, 1, 3):
+            outputs = test_list.apply(Blur(), parallel=parallel, chunk_size=chunk_size)
+            assert all(outputs[i] == expected[i] for i in range(len(expected)))
+            computed = lazy_list.compute(
+                in_place=False, parallel=parallel, chunk_size=chunk_size
+            )
+            assert all(computed[i] == expected[i] for i in range(len(expected)))
+    List.shutdown()
+
+
+def test_sizes():
+    test_list = List(_distinct_images(2))
+    with pytest.raises(InvalidArgumentError):
+        test_list.apply(Blur(), batch_size=0)
+    with pytest.raises(InvalidArgumentError):
+        test_list.compute(parallel="threads", chunk_size=0)
+
+
+class Shift(Transform):
+    # transform with batches, records the size of each batch
+    batch_size = 3
+    batches = []
+
+    def process(self, image, **kwargs):
+        return np.roll(image, 5, axis=1)
+
+    def process_batch(self, images, **kwargs):
+        Shift.batches.append(len(images))
+        return list(np.roll(np.stack(images), 5, axis=2))
+
+
+class Mean(Shift):
+    outputs = {"mean": Number()}
+
+    def process(self, image, **kwargs):
+        return {"mean": float(image.mean())}
+
+    def process_batch(self, images, **kwargs):
+        Shift.batches.append(len(images))
+        return [{"mean": float(m)} for m in np.stack(images).mean(axis=(1, 2, 3))]
+
+
+def test_batches():
+    test_list = List(_distinct_images())
+    for operation in (Shift(), Mean()):
+        expected = [operation.apply(i) for i in test_list]
+        for batch_size, sizes in ((None, [3, 3, 1]), (2, [2, 2, 2, 1])):
+            Shift.batches = []
+            outputs = test_list.apply(operation, batch_size=batch_size)
+            assert Shift.batches == sizes
+            if isinstance(operation, Mean):
+                assert [o["mean"] for o in outputs] == pytest.approx(
+                    [e["mean"] for e in expected]
+                )
+            else:
+                assert all(outputs[i] == expected[i] for i in range(len(expected)))
+
+
+def test_ray_references():
+    test_list = List(_distinct_images())
+    outputs = test_list.apply(Blur(), parallel="ray", chunk_size=3)
+    assert not any(output.loaded for output in outputs)
+    # results of a previous parallel operation are sent as references
+    outputs = outputs.apply(GrayScale(), parallel="ray", chunk_size=2)
+    assert all(
+        outputs[i] == test_list[i].apply(Blur()).apply(GrayScale())
+        for i in range(len(test_list))
+    )
+    List.shutdown()
+
+
+def test_ray_errors():
+    color = Image("tests/images/lenna.png")
+    test_list = List([color, color.apply(GrayScale())])
+    with pytest.raises(IndexError):
+        test_list.apply(FilterChannels(channels=[0]), parallel="ray", chunk_size=1)
+    with pytest.raises(IndexError):
+        list(test_list.imap(FilterChannels(channels=[0]), parallel="ray"))
+    List.shutdown()
+
+
+def test_worker_loading(tmp_path):
+    images = List(_distinct_images())
+    paths = images.save(tmp_path / "inputs")
+    test_list = List(paths, lazy=True)
+    outputs = test_list.apply(
+        Blur(), parallel=RayExecutor(output=tmp_path / "outputs"), chunk_size=3
+    )
+    assert not any(i.loaded for i in test_list)
+    assert [o._source for o in outputs] == [
+        str(tmp_path / "outputs" / "{}.png".format(i)) for i in range(len(images))
+    ]
+    assert all(outputs[i] == images[i].apply(Blur()) for i in range(len(images)))
+    List.shutdown()
+
+
+def test_imap():
+    test_list = List(_distinct_images())
+    expected = test_list.apply(Blur())
+    for parallel in ("serial", "threads", "processes", "ray"):
+        for ordered in (True, False):
+            outputs = list(
+                test_list.imap(Blur(), parallel=parallel, in_flight=2, ordered=ordered)
+            )
+            indices = [index for index, _ in outputs]
+            if ordered:
+                assert indices == list(range(len(test_list)))
+            else:
+                assert sorted(indices) == list(range(len(test_list)))
+            assert all(output == expected[index] for index, output in outputs)
+    List.shutdown()
+
+    # images are only taken from the source when there is room for them
+    consumed = []
+
+    def source():
+        for index, image in enumerate(test_list):
+            consumed.append(index)
+            yield image
+
+    outputs = get_executor("threads").imap(Blur(), source(), in_flight=2)
+    next(outputs)
+    assert len(consumed) <= 3
+    outputs.close()
+
+
+def test_errors():
+    color = Image("tests/images/lenna.png")
+    # FilterChannels fails on the grayscale images (indices 1 and 3)
+    test_list = List(
+        [
+            color,
+            color.apply(GrayScale()),
+            color.apply(Blur()),
+            Image(np.zeros((8, 8), "uint8")),
+        ]
+    )
+    transform = FilterChannels(channels=[0])
+    for parallel, errors in (
+        ("serial", "skip"),
+        ("threads", "record"),
+        ("ray", "skip"),
+    ):
+        with pytest.warns(UserWarning, match="2 of 4 images failed"):
+            outputs = test_list.apply(
+                transform, parallel=parallel, errors=errors, retries=1
+            )
+        assert len(outputs) == 2
+        assert outputs[1] == test_list[2].apply(transform)
+        assert [f.index for f in outputs.failures] == [1, 3]
+        assert all(f.attempts == 2 for f in outputs.failures)
+        assert outputs.failures[0].error_type == "IndexError"
+
+    with pytest.warns(UserWarning):
+        outputs = list(test_list.imap(transform, parallel="threads", errors="record"))
+    assert sorted(i for i, o in outputs if isinstance(o, ImageFailure)) == [1, 3]
+    with pytest.warns(UserWarning):
+        test_list.apply(transform, in_place=True, errors="skip")
+    assert len(test_list) == 2 and len(test_list.failures) == 2
+    with pytest.raises(IndexError):
+        List([color.apply(GrayScale())]).apply(transform)
+    List.shutdown()
+
+
+class Crash(Transform):
+    # kills the worker process on grayscale images
+    def process(self, image, **kwargs):
+        if image.ndim == 2:
+            os._exit(1)
+        return image
+
+
+def test_worker_crash():
+    images = _distinct_images(6)
+    for index in (1, 4):
+        images[index] = images[index].apply(GrayScale())
+    test_list = List(images)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for chunk_size in (1, 2):
+            outputs = test_list.apply(
+                Crash(),
+                parallel="processes",
+                chunk_size=chunk_size,
+                errors="skip",
+                retries=1,
+            )
+            # only the images that crash fail, the rest of their chunks is processed
+            assert [(f.index, f.attempts) for f in outputs.failures] == [(1, 2), (4, 2)]
+            assert all(outputs[i] == images[j] for i, j in enumerate((0, 2, 3, 5)))
+        outputs = test_list.imap(
+            Crash(), parallel="processes", ordered=True, errors="skip"
+        )
+        assert [index for index, _ in outputs] == [0, 2, 3, 5]
+    with pytest.raises(BrokenProcessPool):
+        List(images[:2]).apply(Crash(), parallel="processes")
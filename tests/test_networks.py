@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+
+import pytest
+
+from easycv.errors import InvalidNetwork
+from easycv.resources import networks
+
+
+@pytest.fixture
+def stub_networks(tmp_path, monkeypatch):
+    # networks built from small temporary files, the cache starts empty
+    monkeypatch.setattr(networks, "_registry", {})
+    monkeypatch.setattr(networks, "_networks", OrderedDict())
+    monkeypatch.setattr(networks, "_loading", {})
+    monkeypatch.setattr(networks, "_memory_limit", networks._memory_limit)
+    monkeypatch.setattr(
+        networks, "get_resource", lambda resource, filename: tmp_path / filename
+    )
+
+    builds = []
+
+    def loader(path):
+        time.sleep(0.05)  # slow enough for concurrent requests to overlap
+        builds.append(path)
+        return object()
+
+    for name in ("a", "b", "c"):
+        (tmp_path / name).write_bytes(bytes(100))
+        networks.register_network(name, name, [name], loader)
+    return builds
+
+
+def test_network_built_once(stub_networks):
+    with networks.use_network("a") as first:
+        pass
+    with networks.use_network("a") as second:
+        pass
+    assert first is second
+    assert len(stub_networks) == 1
+
+    # threads requesting a network that is being loaded wait for a single build
+    threads = [
+        threading.Thread(target=networks.preload_networks, args=("b",))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(stub_networks) == 2
+
+
+def test_network_eviction(stub_networks):
+    networks.set_networks_memory_limit(250)
+    networks.preload_networks("a", "b")
+    assert networks.loaded_networks() == ["a", "b"]
+    with networks.use_network("a"):
+        pass
+    # the least recently used network is evicted
+    networks.preload_networks("c")
+    assert networks.loaded_networks() == ["a", "c"]
+
+    networks.set_networks_memory_limit(100)
+    assert networks.loaded_networks() == ["c"]
+    networks.clear_networks()
+    assert networks.loaded_networks() == []
+
+
+def test_invalid_network(stub_networks):
+    with pytest.raises(InvalidNetwork):
+        with networks.use_network("unknown"):
+            pass
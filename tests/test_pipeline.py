@@ -1,7 +1,18 @@
 import os
 
+from easycv.image import Image
 from easycv.pipeline import Pipeline
-from easycv.transforms import Blur, Noise
+from easycv.transforms import (
+    Blur,
+    Noise,
+    Brightness,
+    Contrast,
+    GammaCorrection,
+    Negative,
+    Mirror,
+    Resize,
+    GrayScale,
+)
 
 
 def test_name():
@@ -51,3 +62,64 @@ def test_save():
     p2 = Pipeline("test.pipe")
     assert p == p2
     os.remove("test.pipe")
+
+
+def test_pointwise_fusion():
+    image = Image("tests/images/lenna.png")
+    for transforms in (
+        [Brightness(beta=10), Contrast(alpha=1.2), GammaCorrection(gamma=0.8)],
+        [Brightness(beta=-254), Negative(), Contrast(alpha=0.5), Negative()],
+    ):
+        sequential = image
+        for transform in transforms:
+            sequential = sequential.apply(transform)
+        assert image.apply(Pipeline(transforms)) == sequential
+
+
+def test_lookup_table_cache(monkeypatch):
+    image = Image("tests/images/lenna.png")
+    pipeline = Pipeline([Brightness(beta=10), Contrast(alpha=1.2)])
+    expected = image.apply(pipeline)
+    built = []
+    lookup_table = Brightness.lookup_table
+    monkeypatch.setattr(
+        Brightness, "lookup_table", lambda t: built.append(t) or lookup_table(t)
+    )
+    for _ in range(3):
+        assert image.apply(pipeline) == expected
+    assert built == []
+
+    # a pipeline with other arguments builds its own table
+    other = Pipeline([Brightness(beta=20), Contrast(alpha=1.2)])
+    for _ in range(3):
+        image.apply(other)
+    assert len(built) == 1
+
+
+def test_stream():
+    image = Image("tests/images/lenna.png")
+    pipeline = Pipeline(
+        [
+            Blur(),
+            Pipeline([Mirror(), Brightness(beta=10)]),
+            Resize(width=100, height=80),
+        ]
+    )
+    frames = [image.array, image.apply(Mirror()).array, image.array]
+    outputs = [output["image"] for output in pipeline.stream(frames)]
+    assert all(
+        Image(output) == Image(pipeline(frame)["image"])
+        for output, frame in zip(outputs, frames)
+    )
+
+    # the last step returns its input (an intermediate array) for grayscale frames
+    pipeline = Pipeline([Blur(), GrayScale()])
+    frames = [
+        image.apply(GrayScale()).array,
+        image.apply(Mirror()).apply(GrayScale()).array,
+    ]
+    outputs = [output["image"] for output in pipeline.stream(frames + frames[:1])]
+    assert all(
+        Image(output) == Image(pipeline(frame)["image"])
+        for output, frame in zip(outputs, frames + frames[:1])
+    )
@@ -0,0 +1,41 @@
+import os
+import tempfile
+
+import easycv.scratch as scratch
+
+
+def _reset(monkeypatch):
+    monkeypatch.setattr(scratch, "_folder", None)
+    monkeypatch.setattr(scratch, "_owner", None)
+
+
+def test_scratch_folder(tmp_path, monkeypatch):
+    _reset(monkeypatch)
+    monkeypatch.delenv("EASYCV_SCRATCH_DIR", raising=False)
+    folder = scratch.get_scratch_folder()
+    assert os.path.dirname(folder) == tempfile.gettempdir()
+    assert scratch.get_scratch_folder() == folder
+    scratch._remove(folder, os.getpid())
+
+    _reset(monkeypatch)
+    monkeypatch.setenv("EASYCV_SCRATCH_DIR", str(tmp_path))
+    folder = scratch.get_scratch_folder()
+    assert os.path.dirname(folder) == str(tmp_path)
+
+    # a forked process (different owner) gets its own folder
+    monkeypatch.setattr(scratch, "_owner", -1)
+    assert scratch.get_scratch_folder() != folder
+
+
+def test_scratch_cleanup(tmp_path, monkeypatch):
+    _reset(monkeypatch)
+    folder = tmp_path / "scratch"
+    folder.mkdir()
+    scratch._remove(str(folder), os.getpid() + 1)  # only the creator removes it
+    assert folder.exists()
+    scratch._remove(str(folder), os.getpid())
+    assert not folder.exists()
+
+    scratch.set_scratch_folder(tmp_path / "shared")
+    assert scratch.get_scratch_folder() == str(tmp_path / "shared")
+    assert scratch._owner is None
@@ -0,0 +1,96 @@
+import cv2
+import numpy as np
+
+from easycv.image import Image
+from easycv.transforms import detect
+from easycv.transforms.base import Transform, _value_range
+from easycv.transforms.detect import Eyes, Faces, FaceFeatures, Smile
+
+
+class Output(Transform):
+    # returns a fixed array, to check how outputs are formatted
+    def __init__(self, output, **kwargs):
+        super().__init__(**kwargs)
+        self.output = output
+
+    def process(self, image, **kwargs):
+        return self.output
+
+
+def _format(output, output_range=None):
+    transform = Output(output)
+    transform.output_range = output_range
+    return transform(np.zeros((2, 2), "uint8"))["image"]
+
+
+def test_uint8_output():
+    # uint8 outputs are returned as they are, masks of 0s and 1s are not stretched to 0/255
+    mask = np.array([[0, 1], [1, 0]], "uint8")
+    assert _format(mask) is mask
+    assert _format(mask).max() == 1
+
+
+def test_float_output():
+    unit = np.array([[0, 0.5], [1, 0.25]], "float32")
+    assert _format(unit).tolist() == [[0, 127], [255, 63]]
+    assert _format(unit * 200).tolist() == [[0, 100], [200, 50]]
+
+    # values outside 0-255 are normalized from the minimum and maximum
+    wide = np.array([[-1, 0], [1, 3]], "float64")
+    assert _format(wide).dtype == np.uint8
+    assert _format(wide).tolist() == [[0, 63], [127, 255]]
+
+    # a declared output range replaces the scan
+    assert _format(unit * 2, output_range=(0, 255)).tolist() == [[0, 1], [2, 0]]
+    assert _format(np.array([True, False])).tolist() == [255, 0]
+
+
+def test_value_range():
+    array = np.random.uniform(-10, 10, (20, 30)).astype("float32")
+    assert _value_range(array) == (array.min(), array.max())
+    strided = array[:, ::2]  # not contiguous, numpy is used
+    assert _value_range(strided) == (strided.min(), strided.max())
+
+
+def _cascade(filename, gray, scale, min_neighbors):
+    # detections of a classifier loaded directly with OpenCV (without the shared registry)
+    classifier = cv2.CascadeClassifier(cv2.data.haarcascades + filename)
+    detections = classifier.detectMultiScale(
+        gray, scaleFactor=scale, minNeighbors=min_neighbors
+    )
+    return [[(x, y), (x + w, y + h)] for x, y, w, h in detections]
+
+
+def _inside(filename, gray, faces, scale, min_neighbors, limit=None):
+    rectangles = []
+    for (lx, ty), (rx, by) in faces:
+        for (x1, y1), (x2, y2) in _cascade(
+            filename, gray[ty:by, lx:rx], scale, min_neighbors
+        )[:limit]:
+            rectangles.append([(x1 + lx, y1 + ty), (x2 + lx, y2 + ty)])
+    return rectangles
+
+
+def _rectangles(rectangles):
+    return [[tuple(int(v) for v in point) for point in r] for r in rectangles]
+
+
+def test_face_features(monkeypatch):
+    # the cascades shipped with OpenCV are used instead of downloading them
+    monkeypatch.setattr(
+        detect, "_cascade_resource", lambda resource, f: cv2.data.haarcascades + f
+    )
+    image = Image("tests/images/lenna.png")
+    gray = cv2.cvtColor(image.array, cv2.COLOR_BGR2GRAY)
+    faces = _cascade("haarcascade_frontalface_default.xml", gray, 1.3, 5)
+    eyes = _inside("haarcascade_eye.xml", gray, faces, 1.1, 3)
+    smiles = _inside("haarcascade_smile.xml", gray, faces, 1.2, 20, limit=1)
+    assert faces
+
+    features = image.apply(FaceFeatures())
+    assert _rectangles(features["faces"]) == _rectangles(faces)
+    assert _rectangles(features["eyes"]) == _rectangles(eyes)
+    assert _rectangles(features["smiles"]) == _rectangles(smiles)
+    assert _rectangles(image.apply(Faces())["rectangles"]) == _rectangles(faces)
+    assert _rectangles(image.apply(Eyes())["rectangles"]) == _rectangles(eyes)
+    assert _rectangles(image.apply(Smile())["rectangles"]) == _rectangles(smiles)